@@ -98,10 +98,11 @@ export function getEngineType(model: string, provider?: LLMProvider): string {
 export async function listModels(
   provider: LLMProvider,
   apiKey?: string,
-  baseUrl?: string
+  baseUrl?: string,
+  forceRefresh = false
 ): Promise<string[]> {
   const resolvedBaseUrl = baseUrl || getProviderBaseUrl(provider);
-  return listModelsFromProvider(resolvedBaseUrl, apiKey);
+  return listModelsFromProvider(resolvedBaseUrl, apiKey, forceRefresh);
 }
 
 /**
@@ -14,6 +14,9 @@ import type {
   LLMProvider,
 } from "./types";
 
+// Longest plain-text error body shown to the user as-is
+const ERROR_TEXT_MAX_LENGTH = 300;
+
 interface OpenAICompatErrorResponse {
   error?: { message?: string } | string;
 }
@@ -22,6 +25,7 @@ interface OpenAICompatUsage {
   prompt_tokens?: number;
   completion_tokens?: number;
   total_tokens?: number;
+  prompt_tokens_details?: { cached_tokens?: number } | null;
 }
 
 interface OpenAICompatChoice {
@@ -61,6 +65,7 @@ function normalizeUsage(
     promptTokens: usage.prompt_tokens,
     completionTokens: usage.completion_tokens,
     totalTokens: usage.total_tokens,
+    cachedTokens: usage.prompt_tokens_details?.cached_tokens,
   };
 }
 
@@ -75,15 +80,16 @@ export interface OpenAICompatConfig {
 }
 
 export class OpenAICompatEngine implements LLMEngine {
-  private config: OpenAICompatConfig;
+  private readonly config: Readonly<OpenAICompatConfig>;
+  private headers?: Record<string, string>;
 
   constructor(config: OpenAICompatConfig) {
-    this.config = {
+    this.config = Object.freeze({
       temperature: 0.7,
       maxTokens: 4096,
       timeout: 120000,
       ...config,
-    };
+    });
   }
 
   getProvider(): LLMProvider {
@@ -103,7 +109,7 @@ export class OpenAICompatEngine implements LLMEngine {
 
     const response = await fetch(this.config.baseUrl + "/chat/completions", {
       method: "POST",
-      headers: this.buildHeaders(),
+      headers: this.getHeaders(),
       body: JSON.stringify({
         model: this.config.model,
         messages,
@@ -143,7 +149,7 @@ export class OpenAICompatEngine implements LLMEngine {
 
     const response = await fetch(this.config.baseUrl + "/chat/completions", {
       method: "POST",
-      headers: this.buildHeaders(),
+      headers: this.getHeaders(),
       body: JSON.stringify({
         model: this.config.model,
         messages,
@@ -209,15 +215,11 @@ export class OpenAICompatEngine implements LLMEngine {
     const start = performance.now();
 
     try {
-      const response = await fetch(this.config.baseUrl + "/chat/completions", {
-        method: "POST",
-        headers: this.buildHeaders(),
-        body: JSON.stringify({
-          model: this.config.model,
-          messages: [{ role: "user", content: "test" }],
-          max_tokens: 5,
-          stream: false,
-        }),
+      // Listing models checks the key and network path without running (and
+      // billing) a completion; only the status matters, so the body is dropped.
+      const response = await fetch(this.config.baseUrl + "/models", {
+        method: "GET",
+        headers: this.getHeaders(),
       });
 
       const latency = performance.now() - start;
@@ -233,6 +235,8 @@ export class OpenAICompatEngine implements LLMEngine {
         };
       }
 
+      void response.body?.cancel();
+
       return {
         success: true,
         latencyMs: Math.round(latency),
@@ -251,6 +255,12 @@ export class OpenAICompatEngine implements LLMEngine {
     }
   }
 
+  // The config is frozen, so the headers only need to be built once.
+  private getHeaders(): Record<string, string> {
+    this.headers ??= this.buildHeaders();
+    return this.headers;
+  }
+
   private buildHeaders(): Record<string, string> {
     const headers: Record<string, string> = {
       "Content-Type": "application/json",
@@ -280,25 +290,57 @@ export class OpenAICompatEngine implements LLMEngine {
   }
 
   private async parseErrorResponse(response: Response): Promise<string> {
+    // Read the body as text so it is always consumed, then try JSON whatever
+    // the content type says. Short plain-text bodies are real messages;
+    // HTML error pages from proxies and gateways are not.
+    let body: string;
     try {
-      const data = await response.json() as OpenAICompatErrorResponse;
-      if (typeof data.error === 'object' && data.error?.message) {
+      body = await response.text();
+    } catch {
+      return "HTTP " + response.status;
+    }
+
+    try {
+      const data = JSON.parse(body) as OpenAICompatErrorResponse | null;
+      if (typeof data?.error === 'object' && data.error?.message) {
         return data.error.message;
       }
-      if (data.error) {
+      if (data?.error) {
         return String(data.error);
       }
       return "HTTP " + response.status;
     } catch {
+      const text = body.trim();
+      if (text && text.length <= ERROR_TEXT_MAX_LENGTH && !text.startsWith("<")) {
+        return text;
+      }
       return "HTTP " + response.status;
     }
   }
 }
 
+// Model lists change rarely, and pickers may ask again on every open.
+const MODEL_LIST_CACHE_TTL_MS = 5 * 60 * 1000;
+const modelListCache = new Map<string, { models: string[]; cachedAt: number }>();
+
 /**
  * List available models from an OpenAI-compatible API endpoint.
+ * Results are cached per base URL and API key for a few minutes unless
+ * forceRefresh is set.
  */
-export async function listModels(baseUrl: string, apiKey?: string): Promise<string[]> {
+export async function listModels(baseUrl: string, apiKey?: string, forceRefresh = false): Promise<string[]> {
+  const cacheKey = baseUrl + "\n" + (apiKey ?? "");
+  const cached = modelListCache.get(cacheKey);
+  if (!forceRefresh && cached && Date.now() - cached.cachedAt < MODEL_LIST_CACHE_TTL_MS) {
+    return [...cached.models];
+  }
+
+  const models = await fetchModelIds(baseUrl, apiKey);
+  modelListCache.set(cacheKey, { models, cachedAt: Date.now() });
+  return [...models];
+}
+
+async function fetchModelIds(baseUrl: string, apiKey?: string): Promise<string[]> {
   const headers: Record<string, string> = {};
 
   if (apiKey) {
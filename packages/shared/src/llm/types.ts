@@ -41,9 +41,18 @@ export interface GenerateResult {
   content: string;
   finishReason?: string;
   usage?: {
+    /**
+     * All prompt tokens, including those read from or written to the
+     * provider's prompt cache (Anthropic reports these separately and they
+     * are added back in)
+     */
     promptTokens: number;
     completionTokens: number;
     totalTokens: number;
+    /** Prompt tokens served from the provider's prompt cache */
+    cachedTokens?: number;
+    /** Prompt tokens written to the provider's prompt cache */
+    cacheCreationTokens?: number;
   };
 }
 
@@ -149,30 +158,73 @@ export function formatAuthHeader(provider: LLMProvider, apiKey: string): string
   }
 }
 
+const PROVIDER_CACHE_LIMIT = 256;
+const providerCache = new Map<string, LLMProvider>();
+
 /**
- * Detect provider from model name
+ * Detect provider from model name.
+ * Pure in the model string, so results are memoized; model pickers and
+ * engine factories call this on every render/request.
  */
 export function detectProviderFromModel(model: string): LLMProvider {
-  const modelLower = model.toLowerCase();
-
-  // Check for explicit provider prefixes
-  if (modelLower.startsWith('openrouter/')) return 'openrouter';
-  if (modelLower.startsWith('openai/')) return 'openai';
-  if (modelLower.startsWith('google/')) return 'google';
-  if (modelLower.startsWith('anthropic/')) return 'anthropic';
-  if (modelLower.startsWith('deepseek/')) return 'deepseek';
-  if (modelLower.startsWith('zai/')) return 'zai';
-  if (modelLower.startsWith('moonshot')) return 'moonshot';
-
-  // Auto-detect based on model name patterns
-  if (modelLower.startsWith('gpt-') || modelLower.startsWith('o1')) {
-    return 'openai';
+  const cached = providerCache.get(model);
+  if (cached) {
+    return cached;
+  }
+
+  const provider = resolveProviderFromModel(model);
+  if (providerCache.size >= PROVIDER_CACHE_LIMIT) {
+    const oldestKey = providerCache.keys().next().value;
+    if (oldestKey !== undefined) {
+      providerCache.delete(oldestKey);
+    }
   }
-  if (modelLower.startsWith('gemini')) {
-    return 'google';
+  providerCache.set(model, provider);
+  return provider;
+}
+
+const UPPERCASE_PATTERN = /[A-Z]/;
+
+// Explicit provider prefixes first, then bare model-name patterns. Grouped
+// by first character so a lookup only tests the prefixes that can match;
+// order within a group is preserved (openrouter/ before openai/ before o1).
+const PROVIDER_PREFIXES: ReadonlyArray<readonly [string, LLMProvider]> = [
+  ['openrouter/', 'openrouter'],
+  ['openai/', 'openai'],
+  ['google/', 'google'],
+  ['anthropic/', 'anthropic'],
+  ['deepseek/', 'deepseek'],
+  ['zai/', 'zai'],
+  ['moonshot', 'moonshot'],
+  ['gpt-', 'openai'],
+  ['o1', 'openai'],
+  ['gemini', 'google'],
+  ['claude', 'anthropic'],
+];
+
+const PROVIDER_PREFIXES_BY_INITIAL = PROVIDER_PREFIXES.reduce((groups, entry) => {
+  const initial = entry[0][0];
+  const group = groups.get(initial);
+  if (group) {
+    group.push(entry);
+  } else {
+    groups.set(initial, [entry]);
   }
-  if (modelLower.startsWith('claude')) {
-    return 'anthropic';
+  return groups;
+}, new Map<string, Array<readonly [string, LLMProvider]>>());
+
+function resolveProviderFromModel(model: string): LLMProvider {
+  // Model IDs are almost always lowercase already; only allocate a lowered
+  // copy when there is something to fold.
+  const modelLower = UPPERCASE_PATTERN.test(model) ? model.toLowerCase() : model;
+
+  const candidates = PROVIDER_PREFIXES_BY_INITIAL.get(modelLower.charAt(0));
+  if (candidates) {
+    for (const [prefix, provider] of candidates) {
+      if (modelLower.startsWith(prefix)) {
+        return provider;
+      }
+    }
   }
 
   // Default to openrouter for unknown models
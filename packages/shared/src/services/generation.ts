@@ -217,13 +217,12 @@ export async function generateAsset(
   const systemPrompt = buildOrchestrator({ template, mode });
 
   // Build prior context
-  let priorContext = '';
-  if (Object.keys(priorAssets).length > 0) {
-    priorContext = '\n\nPrior assets generated:\n';
-    for (const [name, content] of Object.entries(priorAssets)) {
-      priorContext += `\n\n### ${name}\n\n${content.substring(0, 500)}${content.length > 500 ? '...' : ''}\n`;
-    }
-  }
+  const priorEntries = Object.entries(priorAssets);
+  const priorContext = priorEntries.length > 0
+    ? '\n\nPrior assets generated:\n' + priorEntries
+      .map(([name, content]) => `\n\n### ${name}\n\n${content.substring(0, 500)}${content.length > 500 ? '...' : ''}\n`)
+      .join('')
+    : '';
 
   const userPrompt = `Seed: ${seed}${priorContext}\n\nGenerate only the ${assetName} asset.`;
 
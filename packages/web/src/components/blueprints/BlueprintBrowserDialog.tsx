@@ -10,7 +10,7 @@ interface BlueprintBrowserDialogProps {
   open: boolean;
   onClose: () => void;
   onSelect: (blueprint: Blueprint) => void;
-  existingAssets?: string[];
+  existingAssets?: readonly string[];
 }
 
 interface TreeNode {
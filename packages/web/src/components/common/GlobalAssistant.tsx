@@ -34,9 +34,14 @@ export default function GlobalAssistant() {
     : undefined;
 
   const screenContext = useMemo(() => {
-    const matchedPath = Object.keys(screenTitles)
-      .filter((path) => location.pathname === path || location.pathname.startsWith(`${path}/`))
-      .sort((left, right) => right.length - left.length)[0] || location.pathname;
+    let matchedPath = location.pathname;
+    let matchedLength = 0;
+    for (const path of Object.keys(screenTitles)) {
+      if (path.length > matchedLength && (location.pathname === path || location.pathname.startsWith(`${path}/`))) {
+        matchedPath = path;
+        matchedLength = path.length;
+      }
+    }
 
     return {
       screen_name: matchedPath.replace(/^\//, '') || 'home',
@@ -1,4 +1,4 @@
-import { useContext, useEffect, useMemo, useRef } from 'react';
+import { useContext, useEffect, useId, useMemo } from 'react';
 
 import { AssistantContext, type AssistantScreenContext } from './AssistantContext.shared';
 
@@ -12,7 +12,9 @@ export function useAssistantContext() {
 
 export function useAssistantScreenContext(context: AssistantScreenContext) {
   const { setScreenContext, clearScreenContext } = useAssistantContext();
-  const ownerIdRef = useRef(`screen-${Math.random().toString(36).slice(2)}`);
+  // Stable per mounted screen; a useRef initializer would build a fresh
+  // random ID on every render only to throw it away.
+  const ownerId = useId();
   const serializedContext = useMemo(() => JSON.stringify(context), [context]);
   const stableContext = useMemo<AssistantScreenContext>(
     () => JSON.parse(serializedContext) as AssistantScreenContext,
@@ -20,11 +22,10 @@ export function useAssistantScreenContext(context: AssistantScreenContext) {
   );
 
   useEffect(() => {
-    const ownerId = ownerIdRef.current;
     setScreenContext(ownerId, stableContext, serializedContext);
 
     return () => {
       clearScreenContext(ownerId);
     };
-  }, [clearScreenContext, serializedContext, setScreenContext, stableContext]);
+  }, [clearScreenContext, ownerId, serializedContext, setScreenContext, stableContext]);
 }
\ No newline at end of file
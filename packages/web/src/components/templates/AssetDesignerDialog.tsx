@@ -1,25 +1,31 @@
-import { useState, useEffect } from 'react';
+import { lazy, Suspense, useState, useEffect } from 'react';
 import { X, Check, FolderOpen, Edit3, Plus } from 'lucide-react';
 import { type AssetDefinition, type Blueprint } from '@char-gen/shared';
-import BlueprintBrowserDialog from '../blueprints/BlueprintBrowserDialog';
 import { cn } from '../../utils/cn';
 
+// The browser pulls in react-markdown; only load it once it is opened.
+const BlueprintBrowserDialog = lazy(() => import('../blueprints/BlueprintBrowserDialog'));
+
 interface AssetDesignerDialogProps {
   open: boolean;
   onClose: () => void;
   onSave: (asset: AssetDefinition, blueprintContent: string) => void;
   asset?: AssetDefinition;
   blueprintContent?: string;
-  existingAssets?: string[];
+  /** Names of the assets already in the template. Treated as read-only. */
+  existingAssets?: readonly string[];
 }
 
+const NO_ASSETS: readonly string[] = [];
+const ASSET_NAME_PATTERN = /^[a-z_][a-z0-9_]*$/i;
+
 export default function AssetDesignerDialog({
   open,
   onClose,
   onSave,
   asset,
   blueprintContent,
-  existingAssets = [],
+  existingAssets = NO_ASSETS,
 }: AssetDesignerDialogProps) {
   const [name, setName] = useState('');
   const [description, setDescription] = useState('');
@@ -28,6 +34,9 @@ export default function AssetDesignerDialog({
   const [customBlueprint, setCustomBlueprint] = useState('');
   const [selectedBlueprint, setSelectedBlueprint] = useState<Blueprint | null>(null);
   const [showBlueprintBrowser, setShowBlueprintBrowser] = useState(false);
+  // Stays true after the first open so the lazily loaded browser remains
+  // mounted and keeps its search and expanded folders between openings.
+  const [hasOpenedBlueprintBrowser, setHasOpenedBlueprintBrowser] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [dependsOn, setDependsOn] = useState<string[]>([]);
   const [blueprintContentValue, setBlueprintContentValue] = useState('');
@@ -38,6 +47,8 @@ export default function AssetDesignerDialog({
       setName(asset.name);
       setDescription(asset.description);
       setRequired(asset.required);
+      // toggleDependency never mutates in place, so the asset's own list can
+      // seed the selection without a defensive copy.
       setDependsOn(asset.depends_on || []);
       setBlueprintContentValue(blueprintContent || '');
       if (asset.blueprint_file) {
@@ -59,7 +70,7 @@ export default function AssetDesignerDialog({
 
   const validateName = (value: string): string | null => {
     if (!value.trim()) return 'Asset name is required';
-    if (!/^[a-z_][a-z0-9_]*$/i.test(value)) {
+    if (!ASSET_NAME_PATTERN.test(value)) {
       return 'Name must start with letter or underscore and contain only letters, numbers, and underscores';
     }
     if (existingAssets.includes(value) && (!asset || asset.name !== value)) {
@@ -129,12 +140,16 @@ export default function AssetDesignerDialog({
 
   return (
     <>
-      <BlueprintBrowserDialog
-        open={showBlueprintBrowser}
-        onClose={() => setShowBlueprintBrowser(false)}
-        onSelect={handleBlueprintSelected}
-        existingAssets={[]}
-      />
+      {hasOpenedBlueprintBrowser && (
+        <Suspense fallback={null}>
+          <BlueprintBrowserDialog
+            open={showBlueprintBrowser}
+            onClose={() => setShowBlueprintBrowser(false)}
+            onSelect={handleBlueprintSelected}
+            existingAssets={NO_ASSETS}
+          />
+        </Suspense>
+      )}
 
       <div className="fixed inset-0 z-50 flex items-center justify-center">
         {/* Backdrop */}
@@ -234,6 +249,7 @@ export default function AssetDesignerDialog({
                       onClick={(e) => {
                         e.stopPropagation();
                         setShowBlueprintBrowser(true);
+                        setHasOpenedBlueprintBrowser(true);
                       }}
                       className="rounded bg-primary text-primary-foreground px-3 py-1 text-xs hover:bg-primary/90"
                     >
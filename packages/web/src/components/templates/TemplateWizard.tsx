@@ -1,13 +1,16 @@
-import { useEffect, useState } from 'react';
+import { lazy, Suspense, useEffect, useState } from 'react';
 import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { X, ChevronLeft, ChevronRight, Loader2, CheckCircle2 } from 'lucide-react';
 import type { CreateTemplateRequest, AssetDefinition, Template } from '@char-gen/shared';
 import { api } from '@/lib/api';
 import InlineHelpTip from '../common/InlineHelpTip';
 import BasicInfoStep from './wizard/BasicInfoStep';
-import AssetSelectionStep from './wizard/AssetSelectionStep';
-import DependenciesStep from './wizard/DependenciesStep';
-import ReviewStep from './wizard/ReviewStep';
+
+// Steps 2-4 are only built once the user advances past basic info; many
+// sessions are cancelled on the first step.
+const AssetSelectionStep = lazy(() => import('./wizard/AssetSelectionStep'));
+const DependenciesStep = lazy(() => import('./wizard/DependenciesStep'));
+const ReviewStep = lazy(() => import('./wizard/ReviewStep'));
 
 interface TemplateWizardProps {
   open: boolean;
@@ -18,6 +21,27 @@ interface TemplateWizardProps {
 
 type Step = 1 | 2 | 3 | 4;
 
+const WIZARD_STEPS: readonly Step[] = [1, 2, 3, 4];
+
+const STEP_TITLES: Record<Step, string> = {
+  1: 'Basic Information',
+  2: 'Asset Selection',
+  3: 'Dependencies',
+  4: 'Review & Create',
+};
+
+const TEMPLATE_NAME_PATTERN = /^[a-z_][a-z0-9_]*$/i;
+const TEMPLATE_VERSION_PATTERN = /^\d+\.\d+$/;
+
+function WizardStepFallback() {
+  return (
+    <div className="flex items-center justify-center gap-3 py-12 text-sm text-muted-foreground">
+      <Loader2 className="h-4 w-4 animate-spin" />
+      Loading step...
+    </div>
+  );
+}
+
 const defaultTemplateData: CreateTemplateRequest = {
   name: '',
   version: '1.0',
@@ -83,13 +107,13 @@ export default function TemplateWizard({ open, onClose, initialData, templateNam
       // Basic info validation
       if (!templateData.name.trim()) {
         newErrors.name = 'Template name is required';
-      } else if (!/^[a-z_][a-z0-9_]*$/i.test(templateData.name)) {
+      } else if (!TEMPLATE_NAME_PATTERN.test(templateData.name)) {
         newErrors.name = 'Name must start with letter or underscore and contain only letters, numbers, and underscores';
       }
 
       if (!templateData.version.trim()) {
         newErrors.version = 'Version is required';
-      } else if (!/^\d+\.\d+$/.test(templateData.version)) {
+      } else if (!TEMPLATE_VERSION_PATTERN.test(templateData.version)) {
         newErrors.version = 'Version must be in X.Y format (e.g., 1.0)';
       }
     }
@@ -109,13 +133,14 @@ export default function TemplateWizard({ open, onClose, initialData, templateNam
     }
     if (step === 3) {
       // Check for circular dependencies
+      const assetsByName = new Map(templateData.assets.map(a => [a.name, a]));
       for (const asset of templateData.assets) {
         const deps = asset.depends_on || [];
         if (deps.includes(asset.name)) return false;
 
         // Check for transitive circular dependencies
         for (const dep of deps) {
-          const depAsset = templateData.assets.find(a => a.name === dep);
+          const depAsset = assetsByName.get(dep);
           if (depAsset && depAsset.depends_on?.includes(asset.name)) {
             return false;
           }
@@ -164,13 +189,6 @@ export default function TemplateWizard({ open, onClose, initialData, templateNam
 
   if (!open) return null;
 
-  const stepTitles: Record<Step, string> = {
-    1: 'Basic Information',
-    2: 'Asset Selection',
-    3: 'Dependencies',
-    4: 'Review & Create',
-  };
-
   return (
     <div className="fixed inset-0 z-50 flex items-center justify-center">
       {/* Backdrop */}
@@ -183,7 +201,7 @@ export default function TemplateWizard({ open, onClose, initialData, templateNam
           <div>
             <h2 className="text-lg font-semibold">{isEditMode ? 'Edit Template' : 'Create Template'}</h2>
             <p className="text-sm text-muted-foreground">
-              Step {currentStep} of 4: {stepTitles[currentStep]}
+              Step {currentStep} of 4: {STEP_TITLES[currentStep]}
             </p>
           </div>
           {!created && (
@@ -197,7 +215,7 @@ export default function TemplateWizard({ open, onClose, initialData, templateNam
         {!created && (
           <div className="px-4 pt-4">
             <div className="flex items-center gap-2">
-              {[1, 2, 3, 4].map((step) => (
+              {WIZARD_STEPS.map((step) => (
                 <div key={step} className="flex-1">
                   <div className="flex items-center gap-2">
                     <div
@@ -278,25 +296,27 @@ export default function TemplateWizard({ open, onClose, initialData, templateNam
                 />
               )}
 
-              {currentStep === 2 && (
-                <AssetSelectionStep
-                  assets={templateData.assets}
-                  onChange={handleAssetsChange}
-                  blueprintContents={templateData.blueprint_contents}
-                  onBlueprintContentsChange={handleBlueprintContentsChange}
-                />
-              )}
-
-              {currentStep === 3 && (
-                <DependenciesStep
-                  assets={templateData.assets}
-                  onChange={handleAssetsChange}
-                />
-              )}
-
-              {currentStep === 4 && (
-                <ReviewStep templateData={templateData} />
-              )}
+              <Suspense fallback={<WizardStepFallback />}>
+                {currentStep === 2 && (
+                  <AssetSelectionStep
+                    assets={templateData.assets}
+                    onChange={handleAssetsChange}
+                    blueprintContents={templateData.blueprint_contents}
+                    onBlueprintContentsChange={handleBlueprintContentsChange}
+                  />
+                )}
+
+                {currentStep === 3 && (
+                  <DependenciesStep
+                    assets={templateData.assets}
+                    onChange={handleAssetsChange}
+                  />
+                )}
+
+                {currentStep === 4 && (
+                  <ReviewStep templateData={templateData} />
+                )}
+              </Suspense>
             </>
           )}
         </div>
@@ -1,16 +1,26 @@
-import { useState } from 'react';
-import { DndContext, DragEndEvent, closestCenter } from '@dnd-kit/core';
+import { useMemo, useState } from 'react';
+import {
+  DndContext,
+  type DragEndEvent,
+  KeyboardSensor,
+  PointerSensor,
+  closestCenter,
+  useSensor,
+  useSensors,
+} from '@dnd-kit/core';
 import {
   SortableContext,
   verticalListSortingStrategy,
   useSortable,
   arrayMove,
+  sortableKeyboardCoordinates,
 } from '@dnd-kit/sortable';
 import { CSS } from '@dnd-kit/utilities';
 import { GripVertical, Plus, Trash2, FileText, Star } from 'lucide-react';
 import { type AssetDefinition } from '@char-gen/shared';
 import AssetDesignerDialog from '../AssetDesignerDialog';
 import { cn } from '../../../utils/cn';
+import StepHeader from './StepHeader';
 
 interface AssetSelectionStepProps {
   assets: AssetDefinition[];
@@ -103,16 +113,29 @@ export default function AssetSelectionStep({
 }: AssetSelectionStepProps) {
   const [editingAsset, setEditingAsset] = useState<AssetDefinition | undefined>();
   const [showAssetDesigner, setShowAssetDesigner] = useState(false);
+  const assetNames = useMemo(() => assets.map(a => a.name), [assets]);
+  // Require a few pixels of travel before a pointer press becomes a drag, so
+  // clicks on the handle don't run a full drag/collision cycle.
+  const sensors = useSensors(
+    useSensor(PointerSensor, { activationConstraint: { distance: 4 } }),
+    useSensor(KeyboardSensor, { coordinateGetter: sortableKeyboardCoordinates })
+  );
 
   const handleDragEnd = (event: DragEndEvent) => {
     const { active, over } = event;
 
-    if (over && active.id !== over.id) {
-      const oldIndex = assets.findIndex(a => a.name === active.id);
-      const newIndex = assets.findIndex(a => a.name === over.id);
+    // A click on the handle or a drop back in place is not a reorder.
+    if (!over || active.id === over.id) {
+      return;
+    }
 
-      onChange(arrayMove(assets, oldIndex, newIndex));
+    const oldIndex = assetNames.indexOf(String(active.id));
+    const newIndex = assetNames.indexOf(String(over.id));
+    if (oldIndex < 0 || newIndex < 0) {
+      return;
     }
+
+    onChange(arrayMove(assets, oldIndex, newIndex));
   };
 
   const handleAddAsset = () => {
@@ -178,22 +201,16 @@ export default function AssetSelectionStep({
         onSave={handleSaveAsset}
         asset={editingAsset}
         blueprintContent={editingAsset ? blueprintContents[getBlueprintContentKey(editingAsset)] ?? blueprintContents[editingAsset.name] ?? '' : ''}
-        existingAssets={assets.map(a => a.name)}
+        existingAssets={assetNames}
       />
 
       <div className="space-y-6">
         {/* Step Header */}
-        <div className="flex items-start gap-3">
-          <div className="flex-shrink-0 w-8 h-8 rounded-full bg-primary/20 text-primary flex items-center justify-center font-semibold">
-            2
-          </div>
-          <div className="flex-1">
-            <h3 className="text-lg font-semibold">Asset Selection</h3>
-            <p className="text-sm text-muted-foreground">
-              Define the assets that make up your template. Drag to reorder.
-            </p>
-          </div>
-        </div>
+        <StepHeader
+          step={2}
+          title="Asset Selection"
+          description="Define the assets that make up your template. Drag to reorder."
+        />
 
         {/* Asset List */}
         <div className="pl-11">
@@ -212,10 +229,10 @@ export default function AssetSelectionStep({
               </button>
             </div>
           ) : (
-            <DndContext collisionDetection={closestCenter} onDragEnd={handleDragEnd}>
+            <DndContext sensors={sensors} collisionDetection={closestCenter} onDragEnd={handleDragEnd}>
               <div className="space-y-2">
                 <SortableContext
-                  items={assets.map(a => a.name)}
+                  items={assetNames}
                   strategy={verticalListSortingStrategy}
                 >
                   {assets.map((asset) => (
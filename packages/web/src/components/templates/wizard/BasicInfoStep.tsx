@@ -1,4 +1,5 @@
 import { Info } from 'lucide-react';
+import StepHeader from './StepHeader';
 
 interface BasicInfoStepProps {
   name: string;
@@ -12,18 +13,12 @@ export default function BasicInfoStep({ name, version, description, onChange, er
   return (
     <div className="space-y-6">
       {/* Step Header */}
-      <div className="flex items-start gap-3">
-        <div className="flex-shrink-0 w-8 h-8 rounded-full bg-primary/20 text-primary flex items-center justify-center font-semibold">
-          1
-        </div>
-        <div className="flex-1">
-          <h3 className="text-lg font-semibold">Basic Information</h3>
-          <p className="text-sm text-muted-foreground">
-            Define the basic metadata for your template
-          </p>
-        </div>
-        <Info className="h-5 w-5 text-muted-foreground flex-shrink-0" />
-      </div>
+      <StepHeader
+        step={1}
+        title="Basic Information"
+        description="Define the basic metadata for your template"
+        icon={<Info className="h-5 w-5 text-muted-foreground flex-shrink-0" />}
+      />
 
       {/* Form Fields */}
       <div className="space-y-4 pl-11">
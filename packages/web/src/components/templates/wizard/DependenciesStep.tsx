@@ -1,6 +1,7 @@
 import { GitBranch, Check, AlertCircle } from 'lucide-react';
 import { type AssetDefinition } from '@char-gen/shared';
 import { cn } from '../../../utils/cn';
+import StepHeader from './StepHeader';
 
 interface DependenciesStepProps {
   assets: AssetDefinition[];
@@ -26,14 +27,14 @@ export default function DependenciesStep({ assets, onChange }: DependenciesStepP
 
   const validateDependencies = (): Record<string, string> => {
     const errorMap: Record<string, string> = {};
-    const assetSet = new Set(assets.map(a => a.name));
+    const assetsByName = new Map(assets.map(a => [a.name, a]));
 
     for (const asset of assets) {
       const deps = asset.depends_on || [];
 
       // Check for missing dependencies
       for (const dep of deps) {
-        if (!assetSet.has(dep)) {
+        if (!assetsByName.has(dep)) {
           errorMap[asset.name] = `Missing dependency: ${dep}`;
         }
       }
@@ -45,7 +46,7 @@ export default function DependenciesStep({ assets, onChange }: DependenciesStepP
 
       // Check for circular dependencies (transitive)
       for (const dep of deps) {
-        const depAsset = assets.find(a => a.name === dep);
+        const depAsset = assetsByName.get(dep);
         if (depAsset && depAsset.depends_on?.includes(asset.name)) {
           errorMap[asset.name] = 'Circular dependency detected';
         }
@@ -60,17 +61,11 @@ export default function DependenciesStep({ assets, onChange }: DependenciesStepP
   return (
     <div className="space-y-6">
       {/* Step Header */}
-      <div className="flex items-start gap-3">
-        <div className="flex-shrink-0 w-8 h-8 rounded-full bg-primary/20 text-primary flex items-center justify-center font-semibold">
-          3
-        </div>
-        <div className="flex-1">
-          <h3 className="text-lg font-semibold">Dependencies</h3>
-          <p className="text-sm text-muted-foreground">
-            Configure which assets depend on others. Assets will be generated in dependency order.
-          </p>
-        </div>
-      </div>
+      <StepHeader
+        step={3}
+        title="Dependencies"
+        description="Configure which assets depend on others. Assets will be generated in dependency order."
+      />
 
       {/* Dependency Matrix */}
       <div className="pl-11 space-y-4">
@@ -102,8 +97,8 @@ export default function DependenciesStep({ assets, onChange }: DependenciesStepP
             </p>
 
             {assets.map((asset) => {
-              const availableDeps = assets.filter(a => a.name !== asset.name);
               const assetDeps = asset.depends_on || [];
+              const selectedDeps = new Set(assetDeps);
               const hasError = depErrors[asset.name];
 
               return (
@@ -126,20 +121,20 @@ export default function DependenciesStep({ assets, onChange }: DependenciesStepP
                     )}
                   </div>
 
-                  {availableDeps.length === 0 ? (
+                  {assets.length < 2 ? (
                     <p className="text-xs text-muted-foreground italic">
                       No other assets available as dependencies
                     </p>
                   ) : (
                     <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 gap-2">
-                      {availableDeps.map((dep) => (
+                      {assets.map((dep) => dep.name !== asset.name && (
                         <label
                           key={dep.name}
                           className="flex items-center gap-2 px-3 py-2 rounded border border-border hover:bg-accent/50 cursor-pointer transition-colors"
                         >
                           <input
                             type="checkbox"
-                            checked={assetDeps.includes(dep.name)}
+                            checked={selectedDeps.has(dep.name)}
                             onChange={() => handleToggleDependency(asset.name, dep.name)}
                             className="rounded border-input"
                           />
@@ -1,45 +1,50 @@
+import { useMemo } from 'react';
 import { Eye, Copy, Check, AlertTriangle } from 'lucide-react';
 import { type CreateTemplateRequest } from '@char-gen/shared';
+import StepHeader from './StepHeader';
 
 interface ReviewStepProps {
   templateData: CreateTemplateRequest;
 }
 
-export default function ReviewStep({ templateData }: ReviewStepProps) {
-  const generateTOML = (): string => {
-    const lines: string[] = [];
-
-    lines.push(`[template]`);
-    lines.push(`name = "${templateData.name}"`);
-    lines.push(`version = "${templateData.version}"`);
-    if (templateData.description) {
-      lines.push(`description = """${templateData.description}"""`);
+function generateTOML(templateData: CreateTemplateRequest): string {
+  const lines: string[] = [];
+
+  lines.push(`[template]`);
+  lines.push(`name = "${templateData.name}"`);
+  lines.push(`version = "${templateData.version}"`);
+  if (templateData.description) {
+    lines.push(`description = """${templateData.description}"""`);
+  }
+  lines.push('');
+
+  // Assets section
+  templateData.assets.forEach((asset) => {
+    lines.push(`[[template.assets]]`);
+    lines.push(`name = "${asset.name}"`);
+    lines.push(`required = ${asset.required}`);
+    if (asset.description) {
+      lines.push(`description = """${asset.description}"""`);
+    }
+    if (asset.blueprint_file) {
+      lines.push(`blueprint_file = "${asset.blueprint_file}"`);
+    }
+    if (asset.depends_on && asset.depends_on.length > 0) {
+      lines.push(`depends_on = [${asset.depends_on.map(d => `"${d}"`).join(', ')}]`);
     }
     lines.push('');
+  });
 
-    // Assets section
-    templateData.assets.forEach((asset) => {
-      lines.push(`[[template.assets]]`);
-      lines.push(`name = "${asset.name}"`);
-      lines.push(`required = ${asset.required}`);
-      if (asset.description) {
-        lines.push(`description = """${asset.description}"""`);
-      }
-      if (asset.blueprint_file) {
-        lines.push(`blueprint_file = "${asset.blueprint_file}"`);
-      }
-      if (asset.depends_on && asset.depends_on.length > 0) {
-        lines.push(`depends_on = [${asset.depends_on.map(d => `"${d}"`).join(', ')}]`);
-      }
-      lines.push('');
-    });
-
-    return lines.join('\n');
-  };
+  return lines.join('\n');
+}
+
+export default function ReviewStep({ templateData }: ReviewStepProps) {
+  // Built once per template change and shared by the preview and the copy button.
+  const toml = useMemo(() => generateTOML(templateData), [templateData]);
 
   const copyToClipboard = async () => {
     try {
-      await navigator.clipboard.writeText(generateTOML());
+      await navigator.clipboard.writeText(toml);
       // Could show a toast notification here
     } catch (err) {
       console.error('Failed to copy:', err);
@@ -66,18 +71,12 @@ export default function ReviewStep({ templateData }: ReviewStepProps) {
   return (
     <div className="space-y-6">
       {/* Step Header */}
-      <div className="flex items-start gap-3">
-        <div className="flex-shrink-0 w-8 h-8 rounded-full bg-primary/20 text-primary flex items-center justify-center font-semibold">
-          4
-        </div>
-        <div className="flex-1">
-          <h3 className="text-lg font-semibold">Review & Create</h3>
-          <p className="text-sm text-muted-foreground">
-            Review your template configuration before creating
-          </p>
-        </div>
-        <Eye className="h-5 w-5 text-muted-foreground flex-shrink-0" />
-      </div>
+      <StepHeader
+        step={4}
+        title="Review & Create"
+        description="Review your template configuration before creating"
+        icon={<Eye className="h-5 w-5 text-muted-foreground flex-shrink-0" />}
+      />
 
       {/* Review Content */}
       <div className="pl-11 space-y-6">
@@ -174,7 +173,7 @@ export default function ReviewStep({ templateData }: ReviewStepProps) {
           </div>
           <div className="rounded-lg border border-border bg-muted/30 p-4 max-h-[300px] overflow-y-auto">
             <pre className="text-xs font-mono whitespace-pre-wrap">
-              {generateTOML()}
+              {toml}
             </pre>
           </div>
         </div>
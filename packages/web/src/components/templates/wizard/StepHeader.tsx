@@ -0,0 +1,25 @@
+import type { ReactNode } from 'react';
+
+interface StepHeaderProps {
+  step: number;
+  title: string;
+  description: string;
+  icon?: ReactNode;
+}
+
+export default function StepHeader({ step, title, description, icon }: StepHeaderProps) {
+  return (
+    <div className="flex items-start gap-3">
+      <div className="flex-shrink-0 w-8 h-8 rounded-full bg-primary/20 text-primary flex items-center justify-center font-semibold">
+        {step}
+      </div>
+      <div className="flex-1">
+        <h3 className="text-lg font-semibold">{title}</h3>
+        <p className="text-sm text-muted-foreground">
+          {description}
+        </p>
+      </div>
+      {icon}
+    </div>
+  );
+}
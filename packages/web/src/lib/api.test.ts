@@ -0,0 +1,96 @@
+import type { Draft } from '@char-gen/shared';
+import type { GenerationProgress } from './services/generation';
+import { api } from './api';
+
+const mockGetDraft = vi.fn<(reviewId: string) => Promise<Draft | null>>();
+
+vi.mock('./config/manager.js', () => ({
+  configManager: {
+    getConfig: () => ({ batch: { max_concurrent: 3, rate_limit_delay: 2 } }),
+  },
+}));
+
+vi.mock('./services/generation.js', () => ({
+  GenerationService: {
+    generate: async function* (): AsyncGenerator<GenerationProgress> {
+      yield { type: 'chunk', content: 'Name: Test' };
+      yield { type: 'complete', asset: 'draft-id' };
+    },
+  },
+}));
+
+vi.mock('./storage/draft-db.js', () => ({
+  DraftStorage: {
+    getDraft: (reviewId: string) => mockGetDraft(reviewId),
+  },
+}));
+
+describe('api.validatePath', () => {
+  function draftWithNotes(notes: string): Draft {
+    return {
+      path: 'review-id',
+      metadata: {
+        review_id: 'review-id',
+        seed: 'seed',
+        mode: 'SFW',
+        created: '2026-01-01T00:00:00.000Z',
+        modified: '2026-01-01T00:00:00.000Z',
+        favorite: false,
+      },
+      assets: { notes },
+    };
+  }
+
+  it('reports nested placeholders once for each pattern they match', async () => {
+    mockGetDraft.mockResolvedValueOnce(draftWithNotes('Hi (({NAME})), [Name: {AGE}]'));
+
+    const result = await api.validatePath({ path: 'review-id' });
+
+    expect(result.output).toContain(
+      '- notes: unresolved placeholders {NAME}, {AGE}, (({NAME})), [Name: {AGE}]'
+    );
+  });
+
+  it('does not flag an asset without placeholders', async () => {
+    mockGetDraft.mockResolvedValueOnce(draftWithNotes('A finished paragraph (with an aside).'));
+
+    const result = await api.validatePath({ path: 'review-id' });
+
+    expect(result.output).not.toContain('- notes:');
+  });
+});
+
+describe('api.generateBatch', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.setSystemTime(0);
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  async function recordBatchStarts(parallel: boolean): Promise<number[]> {
+    const starts: number[] = [];
+    const stream = api
+      .generateBatch(['first', 'second', 'third'], { mode: 'SFW', parallel, max_concurrent: 3 })
+      .subscribe((event) => {
+        if (event.event === 'batch_start') {
+          starts.push(Date.now());
+        }
+      });
+
+    const done = stream.start();
+    await vi.runAllTimersAsync();
+    await done;
+    return starts;
+  }
+
+  it('spaces sequential seed starts by the configured delay', async () => {
+    expect(await recordBatchStarts(false)).toEqual([0, 2000, 4000]);
+  });
+
+  it('spaces parallel seed starts by the configured delay across workers', async () => {
+    expect(await recordBatchStarts(true)).toEqual([0, 2000, 4000]);
+  });
+});
@@ -48,7 +48,7 @@ import {
   type ValidatePathRequest,
   type ValidationResponse,
 } from '@char-gen/shared';
-import { MODEL_SUGGESTIONS, buildProviderHeaders, createEngine, getDefaultBaseUrl } from './llm/factory.js';
+import { MODEL_SUGGESTIONS, buildProviderHeaders, clearEngineCache, createEngine, getDefaultBaseUrl } from './llm/factory.js';
 import { configManager } from './config/manager.js';
 import { DraftStorage } from './storage/draft-db.js';
 import { GenerationService } from './services/generation.js';
@@ -136,6 +136,30 @@ type OpenAICompatibleModelsPayload = {
 };
 
 const modelsCache = new Map<string, CachedModelsEntry>();
+const NETWORK_BLOCKED_MESSAGE = 'Network request blocked. This may be due to browser privacy settings (common in EU), ad blockers, or firewall restrictions. Try disabling tracking protection for this site or using a different network.';
+const REMOTE_MODEL_LISTING_PROVIDERS = new Set(['openrouter', 'openai', 'deepseek', 'zai', 'moonshot']);
+
+function buildFallbackModels(provider: string): ModelsResponse['models'] {
+  return (MODEL_SUGGESTIONS[provider as LLMProvider] || []).map((id) => ({
+    id,
+    name: id,
+    provider,
+  }));
+}
+
+function waitForDelay(ms: number, signal: AbortSignal): Promise<void> {
+  return new Promise((resolve) => {
+    const onAbort = () => {
+      clearTimeout(timeoutId);
+      resolve();
+    };
+    const timeoutId = setTimeout(() => {
+      signal.removeEventListener('abort', onAbort);
+      resolve();
+    }, ms);
+    signal.addEventListener('abort', onAbort, { once: true });
+  });
+}
 
 const EXPORT_PRESETS: ExportPresetSummary[] = [
   {
@@ -1243,31 +1267,27 @@ function buildDraftListResponse(
 }
 
 function applyDraftFilters(metadata: DraftMetadata[], filters?: DraftFilters): DraftMetadata[] {
-  let result = [...metadata];
-
-  if (filters?.search) {
-    const query = filters.search.toLowerCase();
-    result = result.filter((draft) => [draft.character_name, draft.seed, draft.genre, draft.notes]
-      .filter(Boolean)
-      .some((value) => String(value).toLowerCase().includes(query))
-    );
-  }
-
-  if (filters?.genre) {
-    result = result.filter((draft) => draft.genre === filters.genre);
-  }
-
-  if (filters?.mode) {
-    result = result.filter((draft) => draft.mode === filters.mode);
-  }
-
-  if (filters?.favorite !== undefined) {
-    result = result.filter((draft) => draft.favorite === filters.favorite);
-  }
-
-  if (filters?.tags?.length) {
-    result = result.filter((draft) => filters.tags?.every((tag) => draft.tags?.includes(tag)));
-  }
+  const query = filters?.search?.toLowerCase();
+  const requiredTags = filters?.tags?.length ? filters.tags : undefined;
+
+  // All filters are checked in one pass, cheapest first, instead of
+  // building an intermediate array per filter.
+  let result = metadata.filter((draft) => {
+    if (filters?.genre && draft.genre !== filters.genre) {
+      return false;
+    }
+    if (filters?.mode && draft.mode !== filters.mode) {
+      return false;
+    }
+    if (filters?.favorite !== undefined && draft.favorite !== filters.favorite) {
+      return false;
+    }
+    if (requiredTags && !requiredTags.every((tag) => draft.tags?.includes(tag))) {
+      return false;
+    }
+    return !query || [draft.character_name, draft.seed, draft.genre, draft.notes]
+      .some((value) => value && String(value).toLowerCase().includes(query));
+  });
 
   const sortOrder = filters?.sort_order === 'asc' ? 1 : -1;
   const sortBy = filters?.sort_by ?? 'modified';
@@ -1292,15 +1312,24 @@ function applyDraftFilters(metadata: DraftMetadata[], filters?: DraftFilters): D
   return result;
 }
 
+// Compiled once at module load; String.prototype.match resets lastIndex on
+// global patterns, so sharing them across calls is safe.
+const DRAFT_PLACEHOLDER_PATTERNS: readonly RegExp[] = [
+  /\{[A-Z_][A-Z0-9_]*\}/g,
+  /\(\([^\n]+?\)\)/g,
+  /\[(Name|Age|Content):?[^\]]*\]/g,
+];
+
+// The three patterns fused into one non-global alternation. Most assets have
+// no placeholders, so a single scan clears them; only assets that match are
+// scanned per pattern, which keeps nested placeholders such as "(({NAME}))"
+// reported once for each pattern they match.
+const ANY_DRAFT_PLACEHOLDER_PATTERN = /\{[A-Z_][A-Z0-9_]*\}|\(\([^\n]+?\)\)|\[(?:Name|Age|Content):?[^\]]*\]/;
+
 function validateDraftAssets(draft: Draft): ValidationResponse {
   const findings: string[] = [];
   const template = resolveTemplateDefinition(draft.metadata.template_name) || OFFICIAL_TEMPLATE;
   const requiredAssets = getOrderedAssets(template).filter((asset) => asset.required);
-  const placeholderPatterns = [
-    /\{[A-Z_][A-Z0-9_]*\}/g,
-    /\(\([^\n]+?\)\)/g,
-    /\[(Name|Age|Content):?[^\]]*\]/g,
-  ];
 
   requiredAssets.forEach((asset) => {
     const content = draft.assets[asset.name];
@@ -1315,24 +1344,25 @@ function validateDraftAssets(draft: Draft): ValidationResponse {
       return;
     }
 
-    const matches = placeholderPatterns.flatMap((pattern) => content.match(pattern) ?? []);
-    if (matches.length > 0) {
-      findings.push(`- ${assetName}: unresolved placeholders ${matches.join(', ')}`);
+    if (!ANY_DRAFT_PLACEHOLDER_PATTERN.test(content)) {
+      return;
     }
+
+    const matches = DRAFT_PLACEHOLDER_PATTERNS.flatMap((pattern) => content.match(pattern) ?? []);
+    findings.push(`- ${assetName}: unresolved placeholders ${matches.join(', ')}`);
   });
 
-  if (findings.length === 0) {
-    findings.push('OK: no obvious placeholder violations found in saved assets.');
-  } else {
-    findings.unshift('VALIDATION FAILED');
-  }
+  const failed = findings.length > 0;
+  const output = failed
+    ? `VALIDATION FAILED\n${findings.join('\n')}`
+    : 'OK: no obvious placeholder violations found in saved assets.';
 
   return {
     path: draft.metadata.review_id,
-    output: findings.join('\n'),
+    output,
     errors: '',
-    exit_code: findings[0] === 'VALIDATION FAILED' ? 1 : 0,
-    success: findings[0] !== 'VALIDATION FAILED',
+    exit_code: failed ? 1 : 0,
+    success: !failed,
   };
 }
 
@@ -1490,11 +1520,29 @@ export class EidolonBrowserAPI {
     const url = `${baseUrl}/models`;
     const headers = buildProviderHeaders(provider as LLMProvider, apiKey);
 
-    const response = await fetch(url, {
+    // A malformed custom base URL or header throws the same TypeError as a
+    // network failure once inside fetch, so build the request first and let
+    // those errors surface with their own message.
+    const request = new Request(url, {
       method: 'GET',
       headers,
     });
 
+    let response: Response;
+    try {
+      response = await fetch(request);
+    } catch (error) {
+      // fetch rejects with a TypeError on network failures, but the message
+      // differs per browser ("Failed to fetch", "Load failed", "NetworkError
+      // when attempting to fetch resource."), so classify by type. Only the
+      // fetch call is covered, so a TypeError while reading the payload is
+      // not mistaken for a blocked request.
+      if (error instanceof TypeError) {
+        throw new Error(NETWORK_BLOCKED_MESSAGE);
+      }
+      throw error;
+    }
+
     if (!response.ok) {
       let error = `HTTP ${response.status}`;
       try {
@@ -1512,16 +1560,22 @@ export class EidolonBrowserAPI {
     }
 
     const payload = await response.json() as OpenAICompatibleModelsPayload;
-    const models = (payload.data || [])
-      .filter((model): model is NonNullable<OpenAICompatibleModelsPayload['data']>[number] & { id: string } => Boolean(model?.id))
-      .map((model) => ({
+    // OpenRouter returns several hundred entries; filter and convert in one
+    // pass rather than materializing an intermediate filtered array.
+    const models: ModelsResponse['models'] = [];
+    for (const model of payload.data || []) {
+      if (!model?.id) {
+        continue;
+      }
+      models.push({
         id: model.id,
         name: model.name || model.id,
         provider,
         context_length: model.context_length,
         supports_vision: model.architecture?.input_modalities?.includes('image') || false,
         supports_tools: model.supported_parameters?.includes('tools') || false,
-      }));
+      });
+    }
 
     return {
       provider,
@@ -1545,17 +1599,15 @@ export class EidolonBrowserAPI {
       };
     }
 
-    const fallbackModels = (MODEL_SUGGESTIONS[typedProvider] || []).map((id) => ({
-      id,
-      name: id,
-      provider,
-    }));
-    const supportsRemoteListing = ['openrouter', 'openai', 'deepseek', 'zai', 'moonshot'].includes(provider);
+    // Providers that cannot be listed from the browser go straight to the
+    // suggestions; the outcome (including a failed fetch below) is cached
+    // so the doomed request is not retried on every settings render.
+    const supportsRemoteListing = REMOTE_MODEL_LISTING_PROVIDERS.has(provider);
 
     if (!apiKey || !supportsRemoteListing) {
       const response = {
         provider,
-        models: fallbackModels,
+        models: buildFallbackModels(provider),
         cached: true,
         error: apiKey || supportsRemoteListing ? undefined : 'Provider model listing is not available in browser mode.',
       };
@@ -1574,13 +1626,10 @@ export class EidolonBrowserAPI {
       });
       return response;
     } catch (error) {
-      const isNetworkError = error instanceof TypeError && error.message === 'Failed to fetch';
-      const message = isNetworkError
-        ? 'Network request blocked. This may be due to browser privacy settings (common in EU), ad blockers, or firewall restrictions. Try disabling tracking protection for this site or using a different network.'
-        : (error instanceof Error ? error.message : 'Failed to load models');
+      const message = error instanceof Error ? error.message : 'Failed to load models';
       const response = {
         provider,
-        models: fallbackModels,
+        models: buildFallbackModels(provider),
         cached: true,
         error: message,
       };
@@ -1600,6 +1649,7 @@ export class EidolonBrowserAPI {
     const nextConfig = { ...config };
     if (config.api_keys) {
       configManager.setApiKeys(config.api_keys);
+      clearEngineCache();
       delete nextConfig.api_keys;
     }
     configManager.updateConfig(nextConfig);
@@ -2027,7 +2077,25 @@ export class EidolonBrowserAPI {
 
   generateBatch(seeds: string[], request: Omit<GenerateBatchRequest, 'seeds'>): BrowserStream {
     return new BrowserStream(async ({ emit, signal }) => {
-      const runSeed = async (seed: string, index: number) => {
+      // Seed starts are spaced by the configured delay (in seconds) across all
+      // workers, so a parallel batch stays under provider request-rate limits
+      // instead of bursting into 429s.
+      const rateLimitDelayMs = Math.max(configManager.getConfig().batch?.rate_limit_delay ?? 0, 0) * 1000;
+      let nextStartAt = 0;
+
+      const runSeed = async (seed: string, index: number, onFirstChunk?: () => void) => {
+        if (rateLimitDelayMs > 0) {
+          const now = Date.now();
+          const startAt = Math.max(now, nextStartAt);
+          nextStartAt = startAt + rateLimitDelayMs;
+          if (startAt > now) {
+            await waitForDelay(startAt - now, signal);
+          }
+          if (signal.aborted) {
+            onFirstChunk?.();
+            return;
+          }
+        }
         emit('batch_start', { index, seed });
         try {
           let draftId = '';
@@ -2039,6 +2107,9 @@ export class EidolonBrowserAPI {
             if (signal.aborted) {
               return;
             }
+            if (progress.type === 'chunk') {
+              onFirstChunk?.();
+            }
             if (progress.type === 'complete') {
               draftId = progress.asset || '';
             }
@@ -2046,20 +2117,37 @@ export class EidolonBrowserAPI {
           emit('batch_complete', { index, seed, draft_path: draftId });
         } catch (error) {
           emit('batch_error', { index, seed, error: error instanceof Error ? error.message : 'Batch generation failed' });
+        } finally {
+          onFirstChunk?.();
         }
       };
 
       if (request.parallel) {
         let nextIndex = 0;
         const workerCount = Math.min(Math.max(request.max_concurrent ?? 3, 1), seeds.length || 1);
-        await Promise.all(Array.from({ length: workerCount }, async () => {
-          while (!signal.aborted) {
-            const index = nextIndex;
-            nextIndex += 1;
-            if (index >= seeds.length) {
-              return;
+        // Every seed shares the same orchestrator system prompt. Hold the
+        // other workers until the first seed starts streaming, by which point
+        // the provider has cached that prefix, so the rest reuse it instead of
+        // all paying for a cold prompt at once.
+        let releaseWorkers: () => void = () => {};
+        const prefixWarm = new Promise<void>((resolve) => {
+          releaseWorkers = resolve;
+        });
+        await Promise.all(Array.from({ length: workerCount }, async (_, workerIndex) => {
+          if (workerIndex > 0) {
+            await prefixWarm;
+          }
+          try {
+            while (!signal.aborted) {
+              const index = nextIndex;
+              nextIndex += 1;
+              if (index >= seeds.length) {
+                return;
+              }
+              await runSeed(seeds[index], index, index === 0 ? releaseWorkers : undefined);
             }
-            await runSeed(seeds[index], index);
+          } finally {
+            releaseWorkers();
           }
         }));
       } else {
@@ -2085,8 +2173,10 @@ export class EidolonBrowserAPI {
   }
 
   async analyzeSimilarity(request: SimilarityRequest): Promise<SimilarityResult> {
-    const left = await this.getDraft(request.draft1_id);
-    const right = await this.getDraft(request.draft2_id);
+    const [left, right] = await Promise.all([
+      this.getDraft(request.draft1_id),
+      this.getDraft(request.draft2_id),
+    ]);
     const baseResult = buildSimilarityResult(left, right);
 
     if (!request.include_llm_analysis) {
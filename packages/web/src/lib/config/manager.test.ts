@@ -0,0 +1,35 @@
+import { ConfigManager } from './manager';
+
+describe('ConfigManager batch settings', () => {
+  beforeEach(() => {
+    localStorage.clear();
+  });
+
+  it('defaults the rate limit delay to one second', () => {
+    expect(new ConfigManager().getConfig().batch?.rate_limit_delay).toBe(1);
+  });
+
+  it('converts a stored millisecond rate limit delay to seconds', () => {
+    localStorage.setItem('eidolon.web.config', JSON.stringify({
+      batch: { max_concurrent: 3, rate_limit_delay: 1000 },
+    }));
+
+    expect(new ConfigManager().getConfig().batch?.rate_limit_delay).toBe(1);
+  });
+
+  it('keeps a stored delay that is already in seconds', () => {
+    localStorage.setItem('eidolon.web.config', JSON.stringify({
+      batch: { max_concurrent: 3, rate_limit_delay: 60 },
+    }));
+
+    expect(new ConfigManager().getConfig().batch?.rate_limit_delay).toBe(60);
+  });
+
+  it('clamps a stored delay above the limit instead of rescaling it', () => {
+    localStorage.setItem('eidolon.web.config', JSON.stringify({
+      batch: { max_concurrent: 3, rate_limit_delay: 100 },
+    }));
+
+    expect(new ConfigManager().getConfig().batch?.rate_limit_delay).toBe(60);
+  });
+});
@@ -16,6 +16,9 @@ const LEGACY_API_KEYS_STORAGE_KEYS = ['bpui.web.apiKeys'];
 const API_KEYS_PERSISTENCE_KEY = 'eidolon.web.apiKeys.persist';
 const LEGACY_API_KEYS_PERSISTENCE_KEYS = ['bpui.web.apiKeys.persist'];
 const CONFIG_CHANGED_EVENT = 'eidolon:config-changed';
+// Matches the max of the batch rate limit delay input in settings.
+const MAX_RATE_LIMIT_DELAY_SECONDS = 60;
+const LEGACY_RATE_LIMIT_DELAY_MS = 1000;
 
 /**
  * In-memory API keys storage (cleared on page refresh by default)
@@ -23,6 +26,14 @@ const CONFIG_CHANGED_EVENT = 'eidolon:config-changed';
  */
 let sessionApiKeys: ApiKeys = {};
 
+// Normalized view of sessionApiKeys. getApiKeys runs on every request and
+// model lookup, so normalization is redone only after the keys change.
+let normalizedApiKeysCache: ApiKeys | null = null;
+
+function invalidateApiKeysCache(): void {
+  normalizedApiKeysCache = null;
+}
+
 const CORRUPTED_API_KEY_PATTERNS = [
   /^window\.fetch:/i,
   /cannot convert value in record<bytestring/i,
@@ -142,14 +153,23 @@ export class ConfigManager {
 
   private mergeConfig(config: Partial<Config>): Config {
     const defaults = this.getDefaultConfig();
+    const batch = {
+      ...defaults.batch,
+      ...(config.batch ?? {}),
+    };
+    // Older builds stored a 1000 (milliseconds) default in this seconds
+    // field. Only that exact legacy value is converted; anything else above
+    // the limit was chosen in seconds and is clamped instead.
+    if (batch.rate_limit_delay === LEGACY_RATE_LIMIT_DELAY_MS) {
+      batch.rate_limit_delay = LEGACY_RATE_LIMIT_DELAY_MS / 1000;
+    } else if (batch.rate_limit_delay > MAX_RATE_LIMIT_DELAY_SECONDS) {
+      batch.rate_limit_delay = MAX_RATE_LIMIT_DELAY_SECONDS;
+    }
 
     return {
       ...defaults,
       ...config,
-      batch: {
-        ...defaults.batch,
-        ...(config.batch ?? {}),
-      },
+      batch,
       help: {
         ...defaults.help,
         ...(config.help ?? {}),
@@ -221,7 +241,7 @@ export class ConfigManager {
       api_keys: {},
       batch: {
         max_concurrent: 3,
-        rate_limit_delay: 1000,
+        rate_limit_delay: 1,
       },
       help: createDefaultHelpState(),
     };
@@ -247,7 +267,8 @@ export class ConfigManager {
    * Get API keys (from session or localStorage)
    */
   getApiKeys(): ApiKeys {
-    return normalizeApiKeys(sessionApiKeys);
+    normalizedApiKeysCache ??= normalizeApiKeys(sessionApiKeys);
+    return { ...normalizedApiKeysCache };
   }
 
   /**
@@ -268,6 +289,7 @@ export class ConfigManager {
     } else {
       delete sessionApiKeys[provider];
     }
+    invalidateApiKeysCache();
     this.persistApiKeysIfNeeded();
   }
 
@@ -279,6 +301,7 @@ export class ConfigManager {
       ...normalizeApiKeys(sessionApiKeys),
       ...normalizeApiKeys(keys),
     };
+    invalidateApiKeysCache();
     this.persistApiKeysIfNeeded();
   }
 
@@ -287,6 +310,7 @@ export class ConfigManager {
    */
   clearApiKey(provider: string): void {
     delete sessionApiKeys[provider];
+    invalidateApiKeysCache();
     this.persistApiKeysIfNeeded();
   }
 
@@ -295,6 +319,7 @@ export class ConfigManager {
    */
   clearAllApiKeys(): void {
     sessionApiKeys = {};
+    invalidateApiKeysCache();
     this.persistApiKeysIfNeeded();
   }
 
@@ -311,6 +336,7 @@ export class ConfigManager {
       if (stored) {
         const parsed = normalizeApiKeys(JSON.parse(stored.value) as ApiKeys);
         sessionApiKeys = parsed;
+        invalidateApiKeysCache();
         if (stored.sourceKey !== API_KEYS_STORAGE_KEY) {
           writeStoredValue(API_KEYS_STORAGE_KEY, LEGACY_API_KEYS_STORAGE_KEYS, JSON.stringify(parsed));
         }
@@ -377,6 +403,7 @@ export class ConfigManager {
     try {
       const keys = JSON.parse(json) as ApiKeys;
       sessionApiKeys = normalizeApiKeys(keys);
+      invalidateApiKeysCache();
       this.persistApiKeysIfNeeded();
     } catch {
       throw new Error('Invalid API keys JSON');
@@ -456,6 +483,7 @@ export class ConfigManager {
   clearAll(): void {
     this.config = this.getDefaultConfig();
     sessionApiKeys = {};
+    invalidateApiKeysCache();
     persistKeys = false;
     try {
       removeStoredValues([CONFIG_STORAGE_KEY, ...LEGACY_CONFIG_STORAGE_KEYS]);
@@ -1106,15 +1106,18 @@ function routeSupportsPath(routePath: string, stepPath: string, matchMode: 'exac
 }
 
 export function resolvePageHelp(pathname: string): PageHelpEntry | null {
-  const matches = pageHelpEntries.filter((entry) =>
-    entry.matchMode === 'exact' ? pathname === entry.match : pathname.startsWith(entry.match)
-  );
+  // Only the most specific (longest) match is needed, so track it in one pass
+  // instead of filtering and sorting. Ties keep the earliest entry.
+  let best: PageHelpEntry | null = null;
 
-  if (matches.length === 0) {
-    return null;
+  for (const entry of pageHelpEntries) {
+    const matches = entry.matchMode === 'exact' ? pathname === entry.match : pathname.startsWith(entry.match);
+    if (matches && (!best || entry.match.length > best.match.length)) {
+      best = entry;
+    }
   }
 
-  return matches.sort((left, right) => right.match.length - left.match.length)[0] ?? null;
+  return best;
 }
 
 export function getGuidedTour(tourId: string): GuidedTour | null {
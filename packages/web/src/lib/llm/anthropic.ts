@@ -6,7 +6,7 @@
 import {
   BaseLLMEngine,
 } from './base.js';
-import { buildProviderHeaders } from './factory.js';
+import { buildProviderHeaders, getDefaultBaseUrl } from './factory.js';
 import type {
   ChatMessage,
   ConnectionTestResult,
@@ -20,9 +20,17 @@ import type {
 // Note: Anthropic SDK is installed as @anthropic-ai/sdk
 // We'll use the REST API directly for better control and to avoid SDK size
 
+const STREAM_EVENTS_WITH_OUTPUT = new Set(['content_block_delta', 'message_delta', 'message_stop']);
+
+interface AnthropicTextBlock {
+  type: 'text';
+  text: string;
+  cache_control?: { type: 'ephemeral' };
+}
+
 interface AnthropicMessage {
   role: string;
-  content: string;
+  content: string | AnthropicTextBlock[];
 }
 
 interface AnthropicDelta {
@@ -49,6 +57,8 @@ interface AnthropicResponse {
   usage: {
     input_tokens: number;
     output_tokens: number;
+    cache_read_input_tokens?: number;
+    cache_creation_input_tokens?: number;
   };
 }
 
@@ -62,16 +72,27 @@ interface AnthropicErrorResponse {
 
 export class AnthropicEngine extends BaseLLMEngine {
   private baseUrl: string;
+  private headers?: Record<string, string>;
+  private streamHeaders?: Record<string, string>;
 
   constructor(config: LLMConfig) {
     super(config);
-    this.baseUrl = config.baseUrl || 'https://api.anthropic.com';
+    this.baseUrl = config.baseUrl || getDefaultBaseUrl('anthropic');
   }
 
   private getHeaders(): Record<string, string> {
-    return buildProviderHeaders('anthropic', this.config.apiKey, {
+    this.headers ??= buildProviderHeaders('anthropic', this.config.apiKey, {
+      contentType: 'application/json',
+    });
+    return this.headers;
+  }
+
+  private getStreamHeaders(): Record<string, string> {
+    this.streamHeaders ??= buildProviderHeaders('anthropic', this.config.apiKey, {
       contentType: 'application/json',
+      accept: 'text/event-stream',
     });
+    return this.streamHeaders;
   }
 
   private formatMessages(messages: ChatMessage[]): AnthropicMessage[] {
@@ -89,43 +110,53 @@ export class AnthropicEngine extends BaseLLMEngine {
       });
     }
 
+    // In a multi-turn chat the next request resends this whole history, so
+    // mark the latest user turn as a cache breakpoint too. Single-shot
+    // requests skip it: a cache write costs more than an uncached read.
+    const last = formatted[formatted.length - 1];
+    if (formatted.length >= 2 && last.role === 'user' && typeof last.content === 'string' && last.content) {
+      last.content = [{ type: 'text', text: last.content, cache_control: { type: 'ephemeral' } }];
+    }
+
     return formatted;
   }
 
-  private getSystemPrompt(messages: ChatMessage[]): string | undefined {
+  private getSystemPrompt(messages: ChatMessage[]): AnthropicTextBlock[] | undefined {
     const systemMsg = messages.find(m => m.role === 'system');
-    return systemMsg?.content;
+    if (!systemMsg?.content) {
+      return undefined;
+    }
+
+    // Blueprint system prompts are long and identical across a generation
+    // run; marking the block lets the API reuse the cached prefix instead of
+    // reprocessing it on every asset.
+    return [{ type: 'text', text: systemMsg.content, cache_control: { type: 'ephemeral' } }];
   }
 
-  async generate(
-    messages: ChatMessage[],
-    options?: GenerateOptions
-  ): Promise<GenerateResult> {
+  private buildRequestBody(messages: ChatMessage[], options: GenerateOptions | undefined, stream: boolean): string {
     const opts = this.mergeOptions(options);
-
     const system = this.getSystemPrompt(messages);
-    const messagesFormatted = this.formatMessages(messages);
 
-    const body: Record<string, unknown> = {
+    return JSON.stringify({
       model: this.config.model,
-      messages: messagesFormatted,
+      messages: this.formatMessages(messages),
       max_tokens: opts.maxTokens || 4096,
       temperature: opts.temperature,
-    };
-
-    if (system) {
-      body.system = system;
-    }
-
-    if (opts.topP !== undefined) {
-      body.top_p = opts.topP;
-    }
+      ...(system && { system }),
+      ...(opts.topP !== undefined && { top_p: opts.topP }),
+      ...(stream && { stream: true }),
+    });
+  }
 
+  protected async requestCompletion(
+    messages: ChatMessage[],
+    options?: GenerateOptions
+  ): Promise<GenerateResult> {
     const response = await this.performFetch(`${this.baseUrl}/v1/messages`, {
       ...this.getFetchOptions(options?.signal),
       method: 'POST',
       headers: this.getHeaders(),
-      body: JSON.stringify(body),
+      body: this.buildRequestBody(messages, options, false),
     });
 
     if (!response.ok) {
@@ -140,13 +171,22 @@ export class AnthropicEngine extends BaseLLMEngine {
       throw new Error('No text content in response');
     }
 
+    // Anthropic's input_tokens only counts the uncached remainder; fold the
+    // cache reads and writes back in so promptTokens means the same thing as
+    // it does for the other providers.
+    const cachedTokens = data.usage.cache_read_input_tokens ?? 0;
+    const cacheCreationTokens = data.usage.cache_creation_input_tokens ?? 0;
+    const promptTokens = data.usage.input_tokens + cachedTokens + cacheCreationTokens;
+
     return {
       content: textContent.text,
       finishReason: data.stop_reason || undefined,
       usage: {
-        promptTokens: data.usage.input_tokens,
+        promptTokens,
         completionTokens: data.usage.output_tokens,
-        totalTokens: data.usage.input_tokens + data.usage.output_tokens,
+        totalTokens: promptTokens + data.usage.output_tokens,
+        cachedTokens,
+        cacheCreationTokens,
       },
     };
   }
@@ -155,35 +195,11 @@ export class AnthropicEngine extends BaseLLMEngine {
     messages: ChatMessage[],
     options?: StreamGenerateOptions
   ): AsyncIterable<StreamChunk> {
-    const opts = this.mergeOptions(options);
-
-    const system = this.getSystemPrompt(messages);
-    const messagesFormatted = this.formatMessages(messages);
-
-    const body: Record<string, unknown> = {
-      model: this.config.model,
-      messages: messagesFormatted,
-      max_tokens: opts.maxTokens || 4096,
-      temperature: opts.temperature,
-      stream: true,
-    };
-
-    if (system) {
-      body.system = system;
-    }
-
-    if (opts.topP !== undefined) {
-      body.top_p = opts.topP;
-    }
-
-    const response = await this.performFetch(`${this.baseUrl}/v1/messages`, {
+    const response = await this.openStream(`${this.baseUrl}/v1/messages`, {
       ...this.getFetchOptions(options?.signal),
       method: 'POST',
-      headers: buildProviderHeaders('anthropic', this.config.apiKey, {
-        contentType: 'application/json',
-        accept: 'text/event-stream',
-      }),
-      body: JSON.stringify(body),
+      headers: this.getStreamHeaders(),
+      body: this.buildRequestBody(messages, options, true),
     });
 
     if (!response.ok) {
@@ -191,59 +207,38 @@ export class AnthropicEngine extends BaseLLMEngine {
       throw new Error(error);
     }
 
-    const reader = response.body?.getReader();
-    if (!reader) {
-      throw new Error('No response body');
-    }
+    for await (const { event: eventName, data: payload } of this.readServerSentEvents(response)) {
+      // The event line names the payload type, so pings, message_start and
+      // block start/stop frames are skipped without parsing them.
+      if (eventName && !STREAM_EVENTS_WITH_OUTPUT.has(eventName)) continue;
 
-    const decoder = new TextDecoder();
-    let buffer = '';
+      try {
+        const event: AnthropicEvent = JSON.parse(payload);
 
-    try {
-      while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
-
-        buffer += decoder.decode(value, { stream: true });
-        const lines = buffer.split('\n');
-        buffer = lines.pop() || '';
-
-        for (const line of lines) {
-          const trimmed = line.trim();
-          if (!trimmed || !trimmed.startsWith('data: ')) continue;
-
-          try {
-            const jsonStr = trimmed.slice(6);
-            const event: AnthropicEvent = JSON.parse(jsonStr);
-
-            if (event.type === 'content_block_delta' && event.delta?.text) {
-              yield {
-                content: event.delta.text,
-                done: false,
-              };
-            }
-
-            if (event.type === 'message_delta' && event.delta?.stop_reason) {
-              yield {
-                content: '',
-                done: true,
-                finishReason: event.delta.stop_reason,
-              };
-            }
-
-            if (event.type === 'message_stop') {
-              yield {
-                content: '',
-                done: true,
-              };
-            }
-          } catch {
-            // Skip invalid JSON lines
-          }
+        if (event.type === 'content_block_delta' && event.delta?.text) {
+          yield {
+            content: event.delta.text,
+            done: false,
+          };
         }
+
+        if (event.type === 'message_delta' && event.delta?.stop_reason) {
+          yield {
+            content: '',
+            done: true,
+            finishReason: event.delta.stop_reason,
+          };
+        }
+
+        if (event.type === 'message_stop') {
+          yield {
+            content: '',
+            done: true,
+          };
+        }
+      } catch {
+        // Skip invalid JSON payloads
       }
-    } finally {
-      reader.releaseLock();
     }
   }
 
@@ -251,15 +246,12 @@ export class AnthropicEngine extends BaseLLMEngine {
     const startTime = performance.now();
 
     try {
-      const response = await this.performFetch(`${this.baseUrl}/v1/messages`, {
+      // Looking the model up checks the key, the model ID and the network
+      // path in one round trip without running (and billing) a completion.
+      const response = await this.performFetch(`${this.baseUrl}/v1/models/${encodeURIComponent(this.config.model)}`, {
         ...this.getFetchOptions(),
-        method: 'POST',
+        method: 'GET',
         headers: this.getHeaders(),
-        body: JSON.stringify({
-          model: this.config.model,
-          messages: [{ role: 'user', content: 'Hi' }],
-          max_tokens: 1,
-        }),
       });
 
       const latency_ms = performance.now() - startTime;
@@ -288,11 +280,7 @@ export class AnthropicEngine extends BaseLLMEngine {
   }
 
   private async parseError(response: Response): Promise<string> {
-    try {
-      const data: AnthropicErrorResponse = await response.json();
-      return data.error?.message || `HTTP ${response.status}`;
-    } catch {
-      return `HTTP ${response.status}`;
-    }
+    const { data, text } = await this.readErrorPayload<AnthropicErrorResponse>(response);
+    return data?.error?.message || text || `HTTP ${response.status}`;
   }
 }
@@ -0,0 +1,312 @@
+import type { ConnectionTestResult, GenerateResult, LLMConfig } from '@char-gen/shared';
+import { BaseLLMEngine, type ServerSentEvent } from './base';
+
+class TestEngine extends BaseLLMEngine {
+  completions = 0;
+
+  constructor(config: Partial<LLMConfig> = {}) {
+    super({ provider: 'openai', model: 'test-model', timeout: 1000, ...config });
+  }
+
+  open(signal?: AbortSignal, url = 'https://example.test/v1/chat/completions'): Promise<Response> {
+    return this.openStream(url, { method: 'POST', signal });
+  }
+
+  async events(chunks: Array<string | Uint8Array>): Promise<ServerSentEvent[]> {
+    const encoder = new TextEncoder();
+    const body = new ReadableStream<Uint8Array>({
+      start(controller) {
+        for (const chunk of chunks) {
+          controller.enqueue(typeof chunk === 'string' ? encoder.encode(chunk) : chunk);
+        }
+        controller.close();
+      },
+    });
+
+    return this.collect(new Response(body));
+  }
+
+  async collect(response: Response): Promise<ServerSentEvent[]> {
+    const events: ServerSentEvent[] = [];
+    for await (const event of this.readServerSentEvents(response)) {
+      events.push(event);
+    }
+    return events;
+  }
+
+  protected async requestCompletion(): Promise<GenerateResult> {
+    this.completions += 1;
+    return {
+      content: `answer ${this.completions}`,
+      usage: { promptTokens: 10, completionTokens: 5, totalTokens: 15 },
+    };
+  }
+
+  async testConnection(): Promise<ConnectionTestResult> {
+    return { success: true };
+  }
+}
+
+describe('BaseLLMEngine.generate', () => {
+  it('answers a repeated deterministic request from the cache with zero usage', async () => {
+    const engine = new TestEngine();
+    const messages = [{ role: 'user' as const, content: 'cache hit' }];
+
+    const first = await engine.generate(messages, { temperature: 0 });
+    const second = await engine.generate(messages, { temperature: 0 });
+
+    expect(engine.completions).toBe(1);
+    expect(second.content).toBe(first.content);
+    expect(second).not.toBe(first);
+    expect(second.usage).toEqual({ promptTokens: 0, completionTokens: 0, totalTokens: 0 });
+    expect(first.usage?.totalTokens).toBe(15);
+  });
+
+  it('does not share cached responses between API keys', async () => {
+    const messages = [{ role: 'user' as const, content: 'per key' }];
+    const first = new TestEngine({ apiKey: 'key-a' });
+    const second = new TestEngine({ apiKey: 'key-b' });
+
+    await first.generate(messages, { temperature: 0 });
+    await second.generate(messages, { temperature: 0 });
+
+    expect(second.completions).toBe(1);
+  });
+
+  it('does not cache sampled requests', async () => {
+    const engine = new TestEngine();
+    const messages = [{ role: 'user' as const, content: 'sampled' }];
+
+    await engine.generate(messages);
+    await engine.generate(messages);
+
+    expect(engine.completions).toBe(2);
+  });
+});
+
+describe('BaseLLMEngine.readServerSentEvents', () => {
+  it('frames lines split across chunks and CRLF line endings', async () => {
+    const events = await new TestEngine().events(['data: {"a"', ':1}\r\n\r\ndata: [DONE]\r\n\r\n']);
+
+    expect(events).toEqual([
+      { event: '', data: '{"a":1}' },
+      { event: '', data: '[DONE]' },
+    ]);
+  });
+
+  it('skips comment lines', async () => {
+    const events = await new TestEngine().events([': OPENROUTER PROCESSING\n\n:\ndata: x\n\n']);
+
+    expect(events).toEqual([{ event: '', data: 'x' }]);
+  });
+
+  it('resets the event name on a blank line', async () => {
+    const events = await new TestEngine().events([
+      'event: content_block_delta\ndata: first\n\ndata: second\n\n',
+    ]);
+
+    expect(events).toEqual([
+      { event: 'content_block_delta', data: 'first' },
+      { event: '', data: 'second' },
+    ]);
+  });
+
+  it('yields each line of a multi-line data field separately', async () => {
+    const events = await new TestEngine().events(['event: message\ndata: one\ndata:two\n\n']);
+
+    expect(events).toEqual([
+      { event: 'message', data: 'one' },
+      { event: 'message', data: 'two' },
+    ]);
+  });
+
+  it('flushes a final event without a trailing newline', async () => {
+    const events = await new TestEngine().events(['data: first\n\ndata: last']);
+
+    expect(events).toEqual([
+      { event: '', data: 'first' },
+      { event: '', data: 'last' },
+    ]);
+  });
+
+  it('decodes a multi-byte character split across chunks', async () => {
+    const bytes = new TextEncoder().encode('data: caf\u00e9 \u{1F600}\n\n');
+    const split = bytes.indexOf(0xf0) + 2;
+
+    const events = await new TestEngine().events([bytes.slice(0, split), bytes.slice(split)]);
+
+    expect(events).toEqual([{ event: '', data: 'caf\u00e9 \u{1F600}' }]);
+  });
+
+  it('cancels a stream that stays silent for the configured timeout', async () => {
+    vi.useFakeTimers();
+    try {
+      const body = new ReadableStream<Uint8Array>({
+        start(controller) {
+          controller.enqueue(new TextEncoder().encode('data: first\n\n'));
+        },
+      });
+
+      const pending = new TestEngine().collect(new Response(body));
+      const result = expect(pending).rejects.toThrow(/stopped responding/);
+      await vi.advanceTimersByTimeAsync(1000);
+
+      await result;
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+});
+
+describe('BaseLLMEngine.openStream', () => {
+  const fetchMock = vi.fn<typeof fetch>();
+
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.stubGlobal('fetch', fetchMock);
+    vi.spyOn(Math, 'random').mockReturnValue(0.5);
+  });
+
+  afterEach(() => {
+    fetchMock.mockReset();
+    vi.unstubAllGlobals();
+    vi.restoreAllMocks();
+    vi.useRealTimers();
+  });
+
+  it.each([408, 425, 429, 500, 502, 503, 504])('retries a %i response before any output', async (status) => {
+    fetchMock
+      .mockResolvedValueOnce(new Response(null, { status }))
+      .mockResolvedValueOnce(new Response('ok'));
+
+    const pending = new TestEngine().open();
+    await vi.runAllTimersAsync();
+
+    expect((await pending).status).toBe(200);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('returns other error statuses without retrying', async () => {
+    fetchMock.mockResolvedValueOnce(new Response(null, { status: 401 }));
+
+    const response = await new TestEngine().open();
+
+    expect(response.status).toBe(401);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('retries network failures reported as a TypeError', async () => {
+    fetchMock
+      .mockRejectedValueOnce(new TypeError('Failed to fetch'))
+      .mockResolvedValueOnce(new Response('ok'));
+
+    const pending = new TestEngine().open();
+    await vi.runAllTimersAsync();
+
+    expect((await pending).status).toBe(200);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('does not retry other fetch errors', async () => {
+    fetchMock.mockRejectedValueOnce(new Error('Request failed'));
+
+    await expect(new TestEngine().open()).rejects.toThrow('Request failed');
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('reports a malformed URL without treating it as a network failure', async () => {
+    await expect(new TestEngine().open(undefined, 'https://exa mple.test/v1')).rejects.toThrow(TypeError);
+    expect(fetchMock).not.toHaveBeenCalled();
+  });
+
+  it('gives up after three attempts and returns the last response', async () => {
+    fetchMock.mockImplementation(async () => new Response(null, { status: 503 }));
+
+    const pending = new TestEngine().open();
+    await vi.runAllTimersAsync();
+
+    expect((await pending).status).toBe(503);
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+
+  it('rethrows a network failure on the last attempt', async () => {
+    fetchMock.mockRejectedValue(new TypeError('Failed to fetch'));
+
+    const pending = new TestEngine().open();
+    const result = expect(pending).rejects.toThrow('Failed to fetch');
+    await vi.runAllTimersAsync();
+
+    await result;
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+
+  it('waits for a Retry-After given in seconds', async () => {
+    fetchMock
+      .mockResolvedValueOnce(new Response(null, { status: 429, headers: { 'Retry-After': '2' } }))
+      .mockResolvedValueOnce(new Response('ok'));
+
+    const pending = new TestEngine().open();
+    await vi.advanceTimersByTimeAsync(1999);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    await vi.advanceTimersByTimeAsync(1);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect((await pending).status).toBe(200);
+  });
+
+  it('waits for a Retry-After given as an HTTP date', async () => {
+    vi.setSystemTime(new Date('2026-01-01T00:00:00Z'));
+    fetchMock
+      .mockResolvedValueOnce(new Response(null, {
+        status: 503,
+        headers: { 'Retry-After': 'Thu, 01 Jan 2026 00:00:03 GMT' },
+      }))
+      .mockResolvedValueOnce(new Response('ok'));
+
+    const pending = new TestEngine().open();
+    await vi.advanceTimersByTimeAsync(2999);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    await vi.advanceTimersByTimeAsync(1);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect((await pending).status).toBe(200);
+  });
+
+  it('returns the response when Retry-After asks for longer than the retry cap', async () => {
+    fetchMock.mockResolvedValueOnce(new Response(null, { status: 429, headers: { 'Retry-After': '30' } }));
+
+    const response = await new TestEngine().open();
+
+    expect(response.status).toBe(429);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('stops retrying when the request is aborted during the wait', async () => {
+    const controller = new AbortController();
+    fetchMock.mockResolvedValue(new Response(null, { status: 503 }));
+
+    const pending = new TestEngine().open(controller.signal);
+    const result = expect(pending).rejects.toThrow(/timed out or was cancelled/);
+    await vi.advanceTimersByTimeAsync(0);
+    controller.abort();
+
+    await result;
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('removes its abort listener when the wait finishes normally', async () => {
+    const controller = new AbortController();
+    const addListener = vi.spyOn(controller.signal, 'addEventListener');
+    const removeListener = vi.spyOn(controller.signal, 'removeEventListener');
+    fetchMock
+      .mockResolvedValueOnce(new Response(null, { status: 503 }))
+      .mockResolvedValueOnce(new Response('ok'));
+
+    const pending = new TestEngine().open(controller.signal);
+    await vi.runAllTimersAsync();
+    await pending;
+
+    expect(addListener).toHaveBeenCalledTimes(1);
+    expect(removeListener).toHaveBeenCalledWith('abort', addListener.mock.calls[0][1]);
+  });
+});
@@ -14,16 +14,47 @@ import type {
   LLMProvider,
 } from '@char-gen/shared';
 
+const RESPONSE_CACHE_LIMIT = 32;
+const responseCache = new Map<string, GenerateResult>();
+
+const STREAM_OPEN_ATTEMPTS = 3;
+const RETRY_BASE_DELAY_MS = 500;
+const RETRY_MAX_DELAY_MS = 8000;
+const RETRYABLE_STATUSES = new Set([408, 425, 429, 500, 502, 503, 504]);
+
+export interface ServerSentEvent {
+  event: string;
+  data: string;
+}
+
+const DEFAULT_TIMEOUT_MS = 180000;
+const STREAM_IDLE_MESSAGE = 'The provider stopped responding mid-stream. Try again.';
+
+// Overall request timers by the signal getFetchOptions handed out, and by
+// the streaming response they now guard, so a stream can stop its timer once
+// the first chunk of the body has arrived.
+const requestTimeouts = new WeakMap<AbortSignal, ReturnType<typeof setTimeout>>();
+const streamTimeouts = new WeakMap<Response, ReturnType<typeof setTimeout>>();
+
+// Longest plain-text error body shown to the user as-is
+const ERROR_TEXT_MAX_LENGTH = 300;
+
+const ABORTED_ERROR_NAMES = new Set(['AbortError', 'TimeoutError']);
+const ABORTED_REQUEST_PATTERN = /operation was aborted/i;
+const ABORTED_REQUEST_MESSAGE = 'The request timed out or was cancelled. Try again, reduce the request size, or choose a faster model/provider.';
+
 export abstract class BaseLLMEngine {
-  protected config: LLMConfig;
+  // Frozen: engines cache headers and the factory shares instances per
+  // configuration, so changing settings means building a new engine.
+  protected readonly config: Readonly<LLMConfig>;
 
   constructor(config: LLMConfig) {
-    this.config = {
+    this.config = Object.freeze({
       temperature: 0.7,
       maxTokens: 4096,
-      timeout: 180000,
+      timeout: DEFAULT_TIMEOUT_MS,
       ...config,
-    };
+    });
   }
 
   protected async performFetch(input: string, init: RequestInit): Promise<Response> {
@@ -35,9 +66,186 @@ export abstract class BaseLLMEngine {
   }
 
   /**
-   * Generate a completion (non-streaming)
+   * Open a streaming request, retrying transient failures that happen before
+   * any output arrives (network errors, 429/5xx on the initial response).
+   * Once a response is returned it is never retried, so callers cannot see
+   * duplicated chunks.
+   */
+  protected async openStream(input: string, init: RequestInit): Promise<Response> {
+    assertRequestIsValid(input, init);
+
+    for (let attempt = 1; ; attempt += 1) {
+      let response: Response;
+      try {
+        response = await fetch(input, init);
+      } catch (error) {
+        if (attempt >= STREAM_OPEN_ATTEMPTS || init.signal?.aborted || !(error instanceof TypeError)) {
+          throw this.normalizeRequestError(error);
+        }
+        await waitBeforeRetry(attempt, null, init.signal);
+        throwIfAborted(init.signal);
+        continue;
+      }
+
+      if (response.ok || attempt >= STREAM_OPEN_ATTEMPTS || !RETRYABLE_STATUSES.has(response.status)) {
+        // config.timeout bounds the wait for the provider to start
+        // answering, which includes the first byte of the body: some
+        // providers send headers immediately and then stall. The timer is
+        // handed to readServerSentEvents, which clears it after the first
+        // chunk so the idle timeout alone governs the rest of a long stream.
+        const timeoutId = response.ok && init.signal ? requestTimeouts.get(init.signal) : undefined;
+        if (timeoutId !== undefined) {
+          streamTimeouts.set(response, timeoutId);
+        }
+        return response;
+      }
+
+      // A server asking for a longer pause than we are willing to wait gets
+      // its error surfaced instead of a retry that would fail the same way.
+      const retryAfterMs = parseRetryAfter(response.headers.get('retry-after'));
+      if (retryAfterMs !== null && retryAfterMs > RETRY_MAX_DELAY_MS) {
+        return response;
+      }
+      void response.body?.cancel();
+      await waitBeforeRetry(attempt, retryAfterMs, init.signal);
+      throwIfAborted(init.signal);
+    }
+  }
+
+  /**
+   * Read a text/event-stream response one data line at a time, tagged with
+   * the most recent event name. Providers send each JSON payload on a single
+   * line, and some relays omit the blank line between events, so data lines
+   * are not joined. Lines are framed with indexOf on one buffer rather than
+   * splitting it into an array per network chunk, and comment lines
+   * (keepalives) are dropped without being copied out. A stream that sends
+   * nothing at all for config.timeout is cancelled with an error instead of
+   * hanging; thinking models can go quiet for minutes, so the idle limit is
+   * never shorter than the configured request timeout.
+   */
+  protected async *readServerSentEvents(response: Response): AsyncIterable<ServerSentEvent> {
+    const reader = response.body?.getReader();
+    if (!reader) {
+      throw new Error('No response body');
+    }
+
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let event = '';
+    let firstChunk = true;
+
+    // One idle timer per stream, armed only while waiting on the network so
+    // a slow consumer is not mistaken for a silent provider. Cancelling the
+    // reader settles the pending read, so no race promise is needed.
+    const idleTimeoutMs = this.config.timeout ?? DEFAULT_TIMEOUT_MS;
+    let idleTimeoutId: ReturnType<typeof setTimeout> | undefined;
+    let idleTimedOut = false;
+    const onIdle = () => {
+      idleTimedOut = true;
+      void reader.cancel();
+    };
+
+    try {
+      while (true) {
+        idleTimeoutId = setTimeout(onIdle, idleTimeoutMs);
+        const { done, value } = await reader.read();
+        clearTimeout(idleTimeoutId);
+        if (idleTimedOut) {
+          throw new Error(STREAM_IDLE_MESSAGE);
+        }
+        if (firstChunk) {
+          firstChunk = false;
+          clearTimeout(streamTimeouts.get(response));
+        }
+        buffer += done ? decoder.decode() + '\n' : decoder.decode(value, { stream: true });
+
+        let start = 0;
+        let end: number;
+        while ((end = buffer.indexOf('\n', start)) !== -1) {
+          const lineEnd = end > start && buffer.charCodeAt(end - 1) === 13 ? end - 1 : end;
+          const lineStart = start;
+          start = end + 1;
+
+          if (lineEnd === lineStart) {
+            event = '';
+            continue;
+          }
+          if (buffer.charCodeAt(lineStart) === 58) continue; // ':' comment
+
+          const line = buffer.slice(lineStart, lineEnd);
+          const colon = line.indexOf(':');
+          const field = colon === -1 ? line : line.slice(0, colon);
+          let fieldValue = colon === -1 ? '' : line.slice(colon + 1);
+          if (fieldValue.charCodeAt(0) === 32) {
+            fieldValue = fieldValue.slice(1);
+          }
+
+          if (field === 'data') {
+            yield { event, data: fieldValue };
+          } else if (field === 'event') {
+            event = fieldValue;
+          }
+        }
+        buffer = buffer.slice(start);
+
+        if (done) break;
+      }
+    } finally {
+      clearTimeout(idleTimeoutId);
+      reader.releaseLock();
+    }
+  }
+
+  /**
+   * Generate a completion (non-streaming).
+   * Deterministic requests (temperature 0) are answered from a small
+   * response cache when the exact same request was made before with the
+   * same key and endpoint. A cache hit returns a copy whose usage is zeroed,
+   * since no tokens were spent on it.
    */
-  abstract generate(
+  async generate(
+    messages: ChatMessage[],
+    options?: GenerateOptions
+  ): Promise<GenerateResult> {
+    const opts = this.mergeOptions(options);
+    if (opts.temperature !== 0) {
+      return this.requestCompletion(messages, options);
+    }
+
+    const key = JSON.stringify([
+      this.config.provider,
+      this.config.model,
+      this.config.apiKey ?? null,
+      this.config.baseUrl ?? null,
+      messages,
+      opts.maxTokens ?? null,
+      opts.topP ?? null,
+      opts.frequencyPenalty ?? null,
+      opts.presencePenalty ?? null,
+    ]);
+    const cached = responseCache.get(key);
+    if (cached) {
+      return {
+        ...cached,
+        usage: cached.usage && { promptTokens: 0, completionTokens: 0, totalTokens: 0 },
+      };
+    }
+
+    const result = await this.requestCompletion(messages, options);
+    if (responseCache.size >= RESPONSE_CACHE_LIMIT) {
+      const oldestKey = responseCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        responseCache.delete(oldestKey);
+      }
+    }
+    responseCache.set(key, result);
+    return result;
+  }
+
+  /**
+   * Send a non-streaming completion request to the provider
+   */
+  protected abstract requestCompletion(
     messages: ChatMessage[],
     options?: GenerateOptions
   ): Promise<GenerateResult>;
@@ -114,21 +322,47 @@ export abstract class BaseLLMEngine {
       ? anySignal([signal, controller.signal])
       : controller.signal;
 
+    requestTimeouts.set(combinedSignal, timeoutId);
+
     return {
       signal: combinedSignal as AbortSignal,
     };
   }
 
+  /**
+   * Read an error body, parsed as JSON when it is JSON whatever the
+   * content type claims. Otherwise a short plain-text body is kept as the
+   * message, while HTML error pages from proxies are dropped.
+   */
+  protected async readErrorPayload<T>(response: Response): Promise<{ data: T | null; text: string | null }> {
+    let body: string;
+    try {
+      body = await response.text();
+    } catch {
+      return { data: null, text: null };
+    }
+
+    try {
+      return { data: JSON.parse(body) as T, text: null };
+    } catch {
+      const text = body.trim();
+      const isMessage = text.length > 0 && text.length <= ERROR_TEXT_MAX_LENGTH && !text.startsWith('<');
+      return { data: null, text: isMessage ? text : null };
+    }
+  }
+
   protected normalizeRequestError(error: unknown): Error {
-    if (error instanceof Error && error.name === 'AbortError') {
-      return new Error('The request timed out or was cancelled. Try again, reduce the request size, or choose a faster model/provider.');
+    if (!(error instanceof Error)) {
+      return new Error('Request failed');
     }
 
-    if (error instanceof Error && /operation was aborted/i.test(error.message)) {
-      return new Error('The request timed out or was cancelled. Try again, reduce the request size, or choose a faster model/provider.');
+    // The error name identifies aborts in every browser; the message check
+    // only covers runtimes that wrap them in a plain Error.
+    if (ABORTED_ERROR_NAMES.has(error.name) || ABORTED_REQUEST_PATTERN.test(error.message)) {
+      return new Error(ABORTED_REQUEST_MESSAGE);
     }
 
-    return error instanceof Error ? error : new Error('Request failed');
+    return error;
   }
 }
 
@@ -148,3 +382,60 @@ function anySignal(signals: AbortSignal[]): AbortSignal {
 
   return controller.signal;
 }
+
+/**
+ * Build the request once up front. fetch reports a malformed URL or header
+ * with the same TypeError it uses for network failures, so without this a
+ * bad custom base URL would be retried and then reported as a network error.
+ */
+function assertRequestIsValid(input: string, init: RequestInit): void {
+  new Request(input, init);
+}
+
+/**
+ * Stop retrying once the request was cancelled or timed out while waiting
+ */
+function throwIfAborted(signal?: AbortSignal | null): void {
+  if (signal?.aborted) {
+    throw new Error(ABORTED_REQUEST_MESSAGE);
+  }
+}
+
+/**
+ * Convert a Retry-After header (delay in seconds or an HTTP date) to
+ * milliseconds, or null when it is missing or malformed
+ */
+function parseRetryAfter(header: string | null): number | null {
+  if (!header) {
+    return null;
+  }
+
+  const seconds = Number(header);
+  if (Number.isFinite(seconds)) {
+    return Math.max(seconds * 1000, 0);
+  }
+
+  const retryAt = Date.parse(header);
+  return Number.isNaN(retryAt) ? null : Math.max(retryAt - Date.now(), 0);
+}
+
+/**
+ * Wait before the next attempt: the server's Retry-After when given,
+ * otherwise full-jitter exponential backoff. Both are capped and resolve
+ * early if the request is aborted.
+ */
+function waitBeforeRetry(attempt: number, retryAfterMs: number | null, signal?: AbortSignal | null): Promise<void> {
+  const delay = retryAfterMs ?? Math.random() * RETRY_BASE_DELAY_MS * 2 ** attempt;
+
+  return new Promise((resolve) => {
+    const onAbort = () => {
+      clearTimeout(timeoutId);
+      resolve();
+    };
+    const timeoutId = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort);
+      resolve();
+    }, Math.min(delay, RETRY_MAX_DELAY_MS));
+    signal?.addEventListener('abort', onAbort, { once: true });
+  });
+}
@@ -5,6 +5,7 @@
 
 import type { ApiKeys, LLMConfig, LLMProvider } from '@char-gen/shared';
 import { detectProviderFromModel } from '@char-gen/shared';
+import type { BaseLLMEngine } from './base.js';
 import { OpenAICompatEngine } from './openai-compat.js';
 import { GoogleEngine } from './google.js';
 import { AnthropicEngine } from './anthropic.js';
@@ -41,10 +42,26 @@ function resolveApiKey(provider: LLMProvider, apiKey?: string, apiKeys?: ApiKeys
   );
 }
 
+const ENGINE_CACHE_LIMIT = 8;
+const engineCache = new Map<string, BaseLLMEngine>();
+
+function engineCacheKey(config: LLMConfig): string {
+  return JSON.stringify([
+    config.provider,
+    config.model,
+    config.apiKey ?? null,
+    config.baseUrl ?? null,
+    config.temperature ?? null,
+    config.maxTokens ?? null,
+  ]);
+}
+
 /**
- * Create an LLM engine based on the model name and configuration
+ * Create an LLM engine based on the model name and configuration.
+ * Engines only hold their config, so identical configurations share one
+ * cached instance instead of being rebuilt on every request.
  */
-export function createEngine(options: CreateEngineOptions) {
+export function createEngine(options: CreateEngineOptions): BaseLLMEngine {
   const {
     model,
     apiKey,
@@ -66,8 +83,66 @@ export function createEngine(options: CreateEngineOptions) {
     maxTokens,
   };
 
+  const key = engineCacheKey(config);
+  const cached = engineCache.get(key);
+  if (cached) {
+    return cached;
+  }
+
+  const engine = instantiateEngine(config);
+  preconnectToProvider(config.baseUrl || getDefaultBaseUrl(provider));
+  if (engineCache.size >= ENGINE_CACHE_LIMIT) {
+    const oldestKey = engineCache.keys().next().value;
+    if (oldestKey !== undefined) {
+      engineCache.delete(oldestKey);
+    }
+  }
+  engineCache.set(key, engine);
+  return engine;
+}
+
+const preconnectedOrigins = new Set<string>();
+
+// The browser pools connections per origin, but the first request to a
+// provider still pays DNS + TCP + TLS setup. Hint the connection as soon as
+// an engine is built so it is usually warm by the time the prompt is sent.
+function preconnectToProvider(baseUrl: string): void {
+  if (typeof document === 'undefined') {
+    return;
+  }
+
+  let origin: string;
+  try {
+    origin = new URL(baseUrl).origin;
+  } catch {
+    return;
+  }
+
+  if (preconnectedOrigins.has(origin)) {
+    return;
+  }
+  preconnectedOrigins.add(origin);
+
+  const link = document.createElement('link');
+  link.rel = 'preconnect';
+  link.href = origin;
+  // API requests are CORS without credentials; the hinted connection has to
+  // match that mode to be reused.
+  link.crossOrigin = 'anonymous';
+  document.head.appendChild(link);
+}
+
+/**
+ * Drop cached engines, e.g. after API keys change so instances holding a
+ * replaced key are not kept alive.
+ */
+export function clearEngineCache(): void {
+  engineCache.clear();
+}
+
+function instantiateEngine(config: LLMConfig): BaseLLMEngine {
   // Create appropriate engine based on provider
-  switch (provider) {
+  switch (config.provider) {
     case 'google':
       return new GoogleEngine(config);
 
@@ -93,26 +168,31 @@ export function getProviderForModel(
   engineMode: 'auto' | 'explicit' = 'auto',
   explicitProvider?: LLMProvider
 ): LLMProvider {
-  if (engineMode === 'explicit' && explicitProvider) {
-    return explicitProvider;
-  }
-  if (explicitProvider) {
-    return explicitProvider;
-  }
-  return detectProviderFromModel(model);
+  // An explicit provider wins in either engine mode, so one check covers
+  // both; otherwise fall back to detection from the model name.
+  return explicitProvider || detectProviderFromModel(model);
+}
+
+interface ProviderRoute {
+  baseUrl: string;
+  authType: 'bearer' | 'raw';
 }
 
+const PROVIDER_ROUTES: Record<LLMProvider, ProviderRoute> = {
+  openai: { baseUrl: 'https://api.openai.com/v1', authType: 'bearer' },
+  google: { baseUrl: 'https://generativelanguage.googleapis.com/v1beta', authType: 'raw' },
+  openrouter: { baseUrl: 'https://openrouter.ai/api/v1', authType: 'bearer' },
+  anthropic: { baseUrl: 'https://api.anthropic.com', authType: 'raw' },
+  deepseek: { baseUrl: 'https://api.deepseek.com', authType: 'bearer' },
+  zai: { baseUrl: 'https://open.bigmodel.cn/api/paas/v4', authType: 'bearer' },
+  moonshot: { baseUrl: 'https://api.moonshot.cn/v1', authType: 'bearer' },
+};
+
 /**
  * Check if a provider requires a specific API key format
  */
 export function getProviderAuthType(provider: LLMProvider): 'bearer' | 'raw' {
-  switch (provider) {
-    case 'google':
-    case 'anthropic':
-      return 'raw';
-    default:
-      return 'bearer';
-  }
+  return PROVIDER_ROUTES[provider]?.authType ?? 'bearer';
 }
 
 export function buildProviderHeaders(
@@ -163,24 +243,7 @@ export function buildProviderHeaders(
  * Get the default base URL for a provider
  */
 export function getDefaultBaseUrl(provider: LLMProvider): string {
-  switch (provider) {
-    case 'openai':
-      return 'https://api.openai.com/v1';
-    case 'google':
-      return 'https://generativelanguage.googleapis.com/v1beta';
-    case 'openrouter':
-      return 'https://openrouter.ai/api/v1';
-    case 'anthropic':
-      return 'https://api.anthropic.com';
-    case 'deepseek':
-      return 'https://api.deepseek.com';
-    case 'zai':
-      return 'https://open.bigmodel.cn/api/paas/v4';
-    case 'moonshot':
-      return 'https://api.moonshot.cn/v1';
-    default:
-      return 'https://api.openai.com/v1';
-  }
+  return PROVIDER_ROUTES[provider]?.baseUrl ?? PROVIDER_ROUTES.openai.baseUrl;
 }
 
 /**
@@ -6,7 +6,7 @@
 import {
   BaseLLMEngine,
 } from './base.js';
-import { buildProviderHeaders } from './factory.js';
+import { buildProviderHeaders, getDefaultBaseUrl } from './factory.js';
 import type {
   ChatMessage,
   ConnectionTestResult,
@@ -35,6 +35,7 @@ interface GeminiUsageMetadata {
   promptTokenCount?: number;
   candidatesTokenCount?: number;
   totalTokenCount?: number;
+  cachedContentTokenCount?: number;
 }
 
 interface GeminiResponse {
@@ -56,16 +57,20 @@ const ROLE_MAP: Record<string, string> = {
 
 export class GoogleEngine extends BaseLLMEngine {
   private baseUrl: string;
+  private headers?: Record<string, string>;
 
   constructor(config: LLMConfig) {
     super(config);
-    this.baseUrl = config.baseUrl || 'https://generativelanguage.googleapis.com/v1beta';
+    this.baseUrl = config.baseUrl || getDefaultBaseUrl('google');
   }
 
+  // The config never changes after construction and the factory shares
+  // instances per configuration, so the request headers are built once.
   private getHeaders(): Record<string, string> {
-    return buildProviderHeaders('google', this.config.apiKey, {
+    this.headers ??= buildProviderHeaders('google', this.config.apiKey, {
       contentType: 'application/json',
     });
+    return this.headers;
   }
 
   private formatMessages(messages: ChatMessage[]): GeminiContent[] {
@@ -96,34 +101,37 @@ export class GoogleEngine extends BaseLLMEngine {
     return contents;
   }
 
-  private async callEndpoint(endpoint: string, body: unknown): Promise<Response> {
-    const url = `${this.baseUrl}${endpoint}`;
+  private buildRequestBody(messages: ChatMessage[], options?: GenerateOptions) {
+    const opts = this.mergeOptions(options);
+
+    return {
+      contents: this.formatMessages(messages),
+      generationConfig: {
+        temperature: opts.temperature,
+        maxOutputTokens: opts.maxTokens,
+        topP: opts.topP,
+      },
+    };
+  }
 
-    return this.performFetch(url, {
+  private async callEndpoint(endpoint: string, body: unknown, stream = false): Promise<Response> {
+    const url = `${this.baseUrl}${endpoint}`;
+    const init: RequestInit = {
       ...this.getFetchOptions(),
       method: 'POST',
       headers: this.getHeaders(),
       body: JSON.stringify(body),
-    });
+    };
+
+    return stream ? this.openStream(url, init) : this.performFetch(url, init);
   }
 
-  async generate(
+  protected async requestCompletion(
     messages: ChatMessage[],
     options?: GenerateOptions
   ): Promise<GenerateResult> {
-    const opts = this.mergeOptions(options);
-
     const endpoint = `/models/${this.config.model}:generateContent`;
-    const body = {
-      contents: this.formatMessages(messages),
-      generationConfig: {
-        temperature: opts.temperature,
-        maxOutputTokens: opts.maxTokens,
-        topP: opts.topP,
-      },
-    };
-
-    const response = await this.callEndpoint(endpoint, body);
+    const response = await this.callEndpoint(endpoint, this.buildRequestBody(messages, options));
 
     if (!response.ok) {
       const error = await this.parseError(response);
@@ -144,6 +152,7 @@ export class GoogleEngine extends BaseLLMEngine {
         promptTokens: data.usageMetadata.promptTokenCount || 0,
         completionTokens: data.usageMetadata.candidatesTokenCount || 0,
         totalTokens: data.usageMetadata.totalTokenCount || 0,
+        cachedTokens: data.usageMetadata.cachedContentTokenCount,
       } : undefined,
     };
   }
@@ -152,75 +161,41 @@ export class GoogleEngine extends BaseLLMEngine {
     messages: ChatMessage[],
     options?: StreamGenerateOptions
   ): AsyncIterable<StreamChunk> {
-    const opts = this.mergeOptions(options);
-
-    const endpoint = `/models/${this.config.model}:streamGenerateContent`;
-    const body = {
-      contents: this.formatMessages(messages),
-      generationConfig: {
-        temperature: opts.temperature,
-        maxOutputTokens: opts.maxTokens,
-        topP: opts.topP,
-      },
-    };
-
-    const response = await this.callEndpoint(endpoint, body);
+    // Without alt=sse Gemini streams one JSON array that only parses once the
+    // response is complete; SSE delivers each candidate chunk as it arrives.
+    const endpoint = `/models/${this.config.model}:streamGenerateContent?alt=sse`;
+    const response = await this.callEndpoint(endpoint, this.buildRequestBody(messages, options), true);
 
     if (!response.ok) {
       const error = await this.parseError(response);
       throw new Error(error);
     }
 
-    const reader = response.body?.getReader();
-    if (!reader) {
-      throw new Error('No response body');
-    }
+    for await (const { data: payload } of this.readServerSentEvents(response)) {
+      try {
+        const data: GeminiStreamResponse = JSON.parse(payload);
 
-    const decoder = new TextDecoder();
-    let buffer = '';
+        const candidate = data.candidates[0];
+        if (!candidate) continue;
 
-    try {
-      while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
-
-        buffer += decoder.decode(value, { stream: true });
-        const lines = buffer.split('\n');
-        buffer = lines.pop() || '';
-
-        for (const line of lines) {
-          const trimmed = line.trim();
-          if (!trimmed || !trimmed.startsWith('data: ')) continue;
-
-          try {
-            const jsonStr = trimmed.slice(6);
-            const data: GeminiStreamResponse = JSON.parse(jsonStr);
-
-            const candidate = data.candidates[0];
-            if (!candidate) continue;
-
-            const text = candidate.content?.parts?.[0]?.text;
-            if (text) {
-              yield {
-                content: text,
-                done: false,
-              };
-            }
-
-            if (candidate.finishReason) {
-              yield {
-                content: '',
-                done: true,
-                finishReason: candidate.finishReason,
-              };
-            }
-          } catch {
-            // Skip invalid JSON lines
-          }
+        const text = candidate.content?.parts?.[0]?.text;
+        if (text) {
+          yield {
+            content: text,
+            done: false,
+          };
         }
+
+        if (candidate.finishReason) {
+          yield {
+            content: '',
+            done: true,
+            finishReason: candidate.finishReason,
+          };
+        }
+      } catch {
+        // Skip invalid JSON payloads
       }
-    } finally {
-      reader.releaseLock();
     }
   }
 
@@ -228,18 +203,13 @@ export class GoogleEngine extends BaseLLMEngine {
     const startTime = performance.now();
 
     try {
-      const endpoint = `/models/${this.config.model}:generateContent`;
-      const body = {
-        contents: [{
-          role: 'user',
-          parts: [{ text: 'test' }],
-        }],
-        generationConfig: {
-          maxOutputTokens: 1,
-        },
-      };
-
-      const response = await this.callEndpoint(endpoint, body);
+      // Fetching the model's metadata exercises the same key and network
+      // path as a generation without spending tokens on a probe prompt.
+      const response = await this.performFetch(`${this.baseUrl}/models/${this.config.model}`, {
+        ...this.getFetchOptions(),
+        method: 'GET',
+        headers: this.getHeaders(),
+      });
 
       const latency_ms = performance.now() - startTime;
 
@@ -267,11 +237,7 @@ export class GoogleEngine extends BaseLLMEngine {
   }
 
   private async parseError(response: Response): Promise<string> {
-    try {
-      const data: { error?: { message?: string; status?: string } } = await response.json();
-      return data.error?.message || data.error?.status || `HTTP ${response.status}`;
-    } catch {
-      return `HTTP ${response.status}`;
-    }
+    const { data, text } = await this.readErrorPayload<{ error?: { message?: string; status?: string } }>(response);
+    return data?.error?.message || data?.error?.status || text || `HTTP ${response.status}`;
   }
 }
@@ -6,7 +6,7 @@
 import {
   BaseLLMEngine,
 } from './base.js';
-import { buildProviderHeaders } from './factory.js';
+import { buildProviderHeaders, getDefaultBaseUrl } from './factory.js';
 import type {
   ChatMessage,
   ConnectionTestResult,
@@ -17,6 +17,8 @@ import type {
   StreamGenerateOptions,
 } from '@char-gen/shared';
 
+const SSE_DONE_SENTINEL = '[DONE]';
+
 interface OpenAIChoice {
   message?: {
     role: string;
@@ -35,10 +37,16 @@ interface OpenAIResponse {
     prompt_tokens: number;
     completion_tokens: number;
     total_tokens: number;
+    prompt_tokens_details?: { cached_tokens?: number } | null;
   };
   model?: string;
 }
 
+interface OpenAIMessage {
+  role: string;
+  content: string | Array<{ type: 'text'; text: string; cache_control?: { type: 'ephemeral' } }>;
+}
+
 interface OpenAIErrorResponse {
   error?: {
     message: string;
@@ -48,33 +56,27 @@ interface OpenAIErrorResponse {
 
 export class OpenAICompatEngine extends BaseLLMEngine {
   private baseUrl: string;
+  private headers?: Record<string, string>;
+  private streamHeaders?: Record<string, string>;
 
   constructor(config: LLMConfig) {
     super(config);
-    this.baseUrl = config.baseUrl || this.getDefaultBaseUrl();
+    this.baseUrl = config.baseUrl || getDefaultBaseUrl(config.provider);
   }
 
-  private getDefaultBaseUrl(): string {
-    switch (this.config.provider) {
-      case 'openai':
-        return 'https://api.openai.com/v1';
-      case 'openrouter':
-        return 'https://openrouter.ai/api/v1';
-      case 'deepseek':
-        return 'https://api.deepseek.com';
-      case 'zai':
-        return 'https://open.bigmodel.cn/api/paas/v4';
-      case 'moonshot':
-        return 'https://api.moonshot.cn/v1';
-      default:
-        return 'https://api.openai.com/v1';
-    }
+  private getHeaders(): Record<string, string> {
+    this.headers ??= buildProviderHeaders(this.config.provider, this.config.apiKey, {
+      contentType: 'application/json',
+    });
+    return this.headers;
   }
 
-  private getHeaders(): Record<string, string> {
-    return buildProviderHeaders(this.config.provider, this.config.apiKey, {
+  private getStreamHeaders(): Record<string, string> {
+    this.streamHeaders ??= buildProviderHeaders(this.config.provider, this.config.apiKey, {
       contentType: 'application/json',
+      accept: 'text/event-stream',
     });
+    return this.streamHeaders;
   }
 
   private isDirectBrowserOpenAIRequest(): boolean {
@@ -97,36 +99,49 @@ export class OpenAICompatEngine extends BaseLLMEngine {
     }
   }
 
-  private formatMessages(messages: ChatMessage[]): Array<{
-    role: string;
-    content: string;
-  }> {
+  private formatMessages(messages: ChatMessage[]): OpenAIMessage[] {
+    const cacheSystemPrompt = this.supportsPromptCacheControl();
+
     return messages.map(m => ({
       role: m.role,
-      content: m.content,
+      content: cacheSystemPrompt && m.role === 'system' && m.content
+        ? [{ type: 'text', text: m.content, cache_control: { type: 'ephemeral' } }]
+        : m.content,
     }));
   }
 
-  async generate(
+  // OpenRouter forwards cache_control breakpoints to Anthropic models, which
+  // (unlike OpenAI-style providers) only reuse prefixes that are marked.
+  private supportsPromptCacheControl(): boolean {
+    return this.config.provider === 'openrouter' && this.config.model.startsWith('anthropic/');
+  }
+
+  private buildRequestBody(messages: ChatMessage[], options: GenerateOptions | undefined, stream: boolean): string {
+    const opts = this.mergeOptions(options);
+
+    return JSON.stringify({
+      model: this.config.model,
+      messages: this.formatMessages(messages),
+      temperature: opts.temperature,
+      max_tokens: opts.maxTokens,
+      top_p: opts.topP,
+      frequency_penalty: opts.frequencyPenalty,
+      presence_penalty: opts.presencePenalty,
+      ...(stream && { stream: true }),
+    });
+  }
+
+  protected async requestCompletion(
     messages: ChatMessage[],
     options?: GenerateOptions
   ): Promise<GenerateResult> {
     this.assertBrowserSupported();
-    const opts = this.mergeOptions(options);
 
     const response = await this.performFetch(`${this.baseUrl}/chat/completions`, {
       ...this.getFetchOptions(options?.signal),
       method: 'POST',
       headers: this.getHeaders(),
-      body: JSON.stringify({
-        model: this.config.model,
-        messages: this.formatMessages(messages),
-        temperature: opts.temperature,
-        max_tokens: opts.maxTokens,
-        top_p: opts.topP,
-        frequency_penalty: opts.frequencyPenalty,
-        presence_penalty: opts.presencePenalty,
-      }),
+      body: this.buildRequestBody(messages, options, false),
     });
 
     if (!response.ok) {
@@ -148,6 +163,7 @@ export class OpenAICompatEngine extends BaseLLMEngine {
         promptTokens: data.usage.prompt_tokens,
         completionTokens: data.usage.completion_tokens,
         totalTokens: data.usage.total_tokens,
+        cachedTokens: data.usage.prompt_tokens_details?.cached_tokens,
       } : undefined,
     };
   }
@@ -157,25 +173,12 @@ export class OpenAICompatEngine extends BaseLLMEngine {
     options?: StreamGenerateOptions
   ): AsyncIterable<StreamChunk> {
     this.assertBrowserSupported();
-    const opts = this.mergeOptions(options);
 
-    const response = await this.performFetch(`${this.baseUrl}/chat/completions`, {
+    const response = await this.openStream(`${this.baseUrl}/chat/completions`, {
       ...this.getFetchOptions(options?.signal),
       method: 'POST',
-      headers: buildProviderHeaders(this.config.provider, this.config.apiKey, {
-        contentType: 'application/json',
-        accept: 'text/event-stream',
-      }),
-      body: JSON.stringify({
-        model: this.config.model,
-        messages: this.formatMessages(messages),
-        temperature: opts.temperature,
-        max_tokens: opts.maxTokens,
-        top_p: opts.topP,
-        frequency_penalty: opts.frequencyPenalty,
-        presence_penalty: opts.presencePenalty,
-        stream: true,
-      }),
+      headers: this.getStreamHeaders(),
+      body: this.buildRequestBody(messages, options, true),
     });
 
     if (!response.ok) {
@@ -183,57 +186,33 @@ export class OpenAICompatEngine extends BaseLLMEngine {
       throw new Error(error);
     }
 
-    const reader = response.body?.getReader();
-    if (!reader) {
-      throw new Error('No response body');
-    }
+    for await (const { data: payload } of this.readServerSentEvents(response)) {
+      if (payload === SSE_DONE_SENTINEL) continue;
 
-    const decoder = new TextDecoder();
-    let buffer = '';
+      try {
+        const data: OpenAIResponse = JSON.parse(payload);
 
-    try {
-      while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
-
-        buffer += decoder.decode(value, { stream: true });
-        const lines = buffer.split('\n');
-        buffer = lines.pop() || '';
-
-        for (const line of lines) {
-          const trimmed = line.trim();
-          if (!trimmed || trimmed === 'data: [DONE]') continue;
-          if (!trimmed.startsWith('data: ')) continue;
-
-          try {
-            const jsonStr = trimmed.slice(6);
-            const data: OpenAIResponse = JSON.parse(jsonStr);
-
-            const choice = data.choices[0];
-            if (!choice) continue;
-
-            const content = choice.delta?.content;
-            if (content) {
-              yield {
-                content,
-                done: false,
-              };
-            }
-
-            if (choice.finish_reason) {
-              yield {
-                content: '',
-                done: true,
-                finishReason: choice.finish_reason,
-              };
-            }
-          } catch {
-            // Skip invalid JSON lines
-          }
+        const choice = data.choices[0];
+        if (!choice) continue;
+
+        const content = choice.delta?.content;
+        if (content) {
+          yield {
+            content,
+            done: false,
+          };
+        }
+
+        if (choice.finish_reason) {
+          yield {
+            content: '',
+            done: true,
+            finishReason: choice.finish_reason,
+          };
         }
+      } catch {
+        // Skip invalid JSON payloads
       }
-    } finally {
-      reader.releaseLock();
     }
   }
 
@@ -266,25 +245,18 @@ export class OpenAICompatEngine extends BaseLLMEngine {
         };
       }
 
-      // Try to get model info
-      try {
-        const data: { data?: Array<{ id: string }>; object?: string } = await response.json();
-        void data.data;
+      // The status is all the probe needs; OpenRouter's model list runs to
+      // hundreds of kilobytes, so drop the body instead of parsing it.
+      void response.body?.cancel();
 
-        return {
-          success: true,
-          latency_ms,
-          model_info: {
-            name: this.config.model,
-            context_length: undefined, // Would need model-specific lookup
-          },
-        };
-      } catch {
-        return {
-          success: true,
-          latency_ms,
-        };
-      }
+      return {
+        success: true,
+        latency_ms,
+        model_info: {
+          name: this.config.model,
+          context_length: undefined, // Would need model-specific lookup
+        },
+      };
     } catch (error) {
       return {
         success: false,
@@ -294,11 +266,7 @@ export class OpenAICompatEngine extends BaseLLMEngine {
   }
 
   private async parseError(response: Response): Promise<string> {
-    try {
-      const data: OpenAIErrorResponse = await response.json();
-      return data.error?.message || `HTTP ${response.status}`;
-    } catch {
-      return `HTTP ${response.status}`;
-    }
+    const { data, text } = await this.readErrorPayload<OpenAIErrorResponse>(response);
+    return data?.error?.message || text || `HTTP ${response.status}`;
   }
 }
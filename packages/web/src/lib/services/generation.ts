@@ -54,6 +54,21 @@ export interface GenerationProgress {
   userPrompt?: string;
 }
 
+// Known asset names in output order
+const KNOWN_BLUEPRINT_SECTIONS = [
+  'Adjustment Note',
+  'system_prompt',
+  'post_history',
+  'character_sheet',
+  'intro_scene',
+  'intro_page',
+  'a1111',
+  'suno',
+];
+
+// Matches any "## <section>" heading; used by the heading-based fallback parser.
+const SECTION_HEADING_PATTERN = new RegExp(`^##\\s*(${KNOWN_BLUEPRINT_SECTIONS.join('|')})`, 'gim');
+
 /**
  * Generation Service
  */
@@ -269,9 +284,11 @@ export class GenerationService {
 
     yield { type: 'status', stage: 'loading_parents' };
 
-    // Load parent drafts
-    const parent1 = await DraftStorage.getDraft(parent1_id);
-    const parent2 = await DraftStorage.getDraft(parent2_id);
+    // Load parent drafts (independent reads, so issue them together)
+    const [parent1, parent2] = await Promise.all([
+      DraftStorage.getDraft(parent1_id),
+      DraftStorage.getDraft(parent2_id),
+    ]);
 
     if (!parent1 || !parent2) {
       yield {
@@ -480,8 +497,10 @@ export class GenerationService {
     draft2Id: string
   ): Promise<unknown> {
     // Load drafts
-    const draft1 = await DraftStorage.getDraft(draft1Id);
-    const draft2 = await DraftStorage.getDraft(draft2Id);
+    const [draft1, draft2] = await Promise.all([
+      DraftStorage.getDraft(draft1Id),
+      DraftStorage.getDraft(draft2Id),
+    ]);
 
     if (!draft1 || !draft2) {
       throw new Error('One or both drafts not found');
@@ -532,18 +551,7 @@ export class GenerationService {
     // Look for code blocks with asset names
     // Format: ```asset_name ... content ... ```
     const codeBlockRegex = /```(\w+)?\n([\s\S]*?)```/g;
-
-    // Known asset names in order
-    const knownAssets = [
-      'Adjustment Note',
-      'system_prompt',
-      'post_history',
-      'character_sheet',
-      'intro_scene',
-      'intro_page',
-      'a1111',
-      'suno',
-    ];
+    const knownAssets = KNOWN_BLUEPRINT_SECTIONS;
 
     // Try to match code blocks with asset name
     let match: RegExpExecArray | null;
@@ -558,20 +566,29 @@ export class GenerationService {
 
     // If no code blocks found, try to parse by known sections
     if (Object.keys(assets).length === 0) {
+      // One pass over the content records every section heading, in order.
+      const headingOffsets = new Map<string, number[]>();
+      for (const heading of content.matchAll(SECTION_HEADING_PATTERN)) {
+        const key = heading[1].toLowerCase();
+        const offsets = headingOffsets.get(key);
+        if (offsets) {
+          offsets.push(heading.index!);
+        } else {
+          headingOffsets.set(key, [heading.index!]);
+        }
+      }
+
       for (let i = 0; i < knownAssets.length; i++) {
         const asset = knownAssets[i];
         const nextAsset = knownAssets[i + 1];
 
-        const startRegex = new RegExp(`^##\\s*${asset}`, 'im');
-        const startMatch = content.search(startRegex);
-
-        if (startMatch === -1) continue;
+        const startMatch = headingOffsets.get(asset.toLowerCase())?.[0];
+        if (startMatch === undefined) continue;
 
         let endMatch: number;
         if (nextAsset) {
-          const endRegex = new RegExp(`^##\\s*${nextAsset}`, 'im');
-          const endSearch = content.slice(startMatch).search(endRegex);
-          endMatch = endSearch === -1 ? content.length : startMatch + endSearch;
+          const endSearch = headingOffsets.get(nextAsset.toLowerCase())?.find((offset) => offset >= startMatch);
+          endMatch = endSearch ?? content.length;
         } else {
           endMatch = content.length;
         }
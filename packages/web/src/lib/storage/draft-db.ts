@@ -73,6 +73,17 @@ export const db = new DraftDatabase(DRAFT_DB_NAME);
 
 let migrationPromise: Promise<void> | null = null;
 
+// Draft listing, lineage and stats each read every draft's metadata, which
+// means loading every draft's assets too. Keep the last result until the
+// database is written to, in this tab or another one.
+let metadataCache: Promise<DraftMetadata[]> | null = null;
+
+function invalidateMetadataCache(): void {
+  metadataCache = null;
+}
+
+Dexie.on('storagemutated', invalidateMetadataCache);
+
 async function migrateLegacyDraftDatabase(): Promise<void> {
   if (typeof indexedDB === 'undefined') {
     return;
@@ -194,6 +205,7 @@ export class DraftStorage {
         await db.tags.bulkAdd(tagEntities);
       }
     });
+    invalidateMetadataCache();
   }
 
   /**
@@ -236,8 +248,17 @@ export class DraftStorage {
   static async getAllMetadata(): Promise<DraftMetadata[]> {
     await this.ensureReady();
 
-    const entities = await db.drafts.toArray();
-    return entities.map(e => e.metadata);
+    if (!metadataCache) {
+      const pending = db.drafts.toArray().then(entities => entities.map(e => e.metadata));
+      metadataCache = pending;
+      pending.catch(() => {
+        if (metadataCache === pending) {
+          metadataCache = null;
+        }
+      });
+    }
+
+    return [...await metadataCache];
   }
 
   /**
@@ -251,6 +272,7 @@ export class DraftStorage {
       await db.assets.where('draftId').equals(reviewId).delete();
       await db.tags.where('draftId').equals(reviewId).delete();
     });
+    invalidateMetadataCache();
   }
 
   /**
@@ -274,6 +296,7 @@ export class DraftStorage {
     existing.updatedAt = now;
 
     await db.drafts.put(existing);
+    invalidateMetadataCache();
 
     // If tags were updated, update the tags index
     if (updates.tags !== undefined) {
@@ -310,6 +333,7 @@ export class DraftStorage {
     };
 
     await db.drafts.put(existing);
+    invalidateMetadataCache();
 
     // Update assets table
     await db.assets
@@ -473,6 +497,7 @@ export class DraftStorage {
       await db.assets.clear();
       await db.tags.clear();
     });
+    invalidateMetadataCache();
 
     for (const legacyName of LEGACY_DRAFT_DB_NAMES) {
       if (await Dexie.exists(legacyName)) {
@@ -38,6 +38,10 @@ function getAssetBlueprintKey(asset: { name: string; blueprint_file?: string }):
   return asset.blueprint_file ?? `${asset.name}.md`;
 }
 
+function getFileName(path: string): string {
+  return path.slice(path.lastIndexOf('/') + 1);
+}
+
 function readStorage<T>(keys: string | readonly string[], fallback: T): T {
   if (typeof window === 'undefined') {
     return fallback;
@@ -82,7 +86,7 @@ function buildDefaultBlueprintCatalog(): Map<string, BrowserBlueprint> {
 
   Object.entries(blueprintModules).forEach(([modulePath, content]) => {
     const normalizedPath = modulePath.replace(/^.*\/blueprints\//, 'blueprints/');
-    const fileName = normalizedPath.split('/').pop()?.toLowerCase();
+    const fileName = getFileName(normalizedPath).toLowerCase();
     if (fileName === 'readme.md') {
       return;
     }
@@ -151,13 +155,19 @@ export function findBlueprintContent(fileName?: string): string {
 
   const normalizedFileName = fileName.replace(/^\.?\//, '');
   const targetBase = normalizedFileName.replace(/\.(txt|md)$/i, '');
-  const match = [...getBlueprintCatalog().values()].find((blueprint) => (
-    blueprint.path === normalizedFileName
-      || blueprint.path.endsWith(`/${normalizedFileName}`)
-      || blueprint.path.endsWith(`/${targetBase}.md`)
-  ));
+  const fileSuffix = `/${normalizedFileName}`;
+  const baseSuffix = `/${targetBase}.md`;
+  for (const blueprint of getBlueprintCatalog().values()) {
+    if (
+      blueprint.path === normalizedFileName
+      || blueprint.path.endsWith(fileSuffix)
+      || blueprint.path.endsWith(baseSuffix)
+    ) {
+      return blueprint.content;
+    }
+  }
 
-  return match?.content ?? '';
+  return '';
 }
 
 function getLegacyBlueprintContent(
@@ -165,7 +175,7 @@ function getLegacyBlueprintContent(
   asset: { name: string; blueprint_file?: string }
 ): string | undefined {
   const blueprintKey = getAssetBlueprintKey(asset);
-  const shortFileName = blueprintKey.split('/').pop() ?? blueprintKey;
+  const shortFileName = getFileName(blueprintKey);
 
   return blueprintContents[blueprintKey]
     ?? blueprintContents[shortFileName]
@@ -4,13 +4,44 @@ import { HashRouter } from 'react-router-dom';
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import App from './App';
 import { ThemeProvider } from './components/common/ThemeProvider';
+import { APIError } from './lib/api';
 import './index.css';
 
+const MAX_QUERY_RETRIES = 1;
+// 4xx responses that describe a temporary condition rather than a bad
+// request: timeout, too early, rate limited.
+const TRANSIENT_CLIENT_STATUSES = new Set([408, 425, 429]);
+
+// Client errors (bad key, missing draft, invalid request) fail the same way
+// on a second attempt, so only retry failures that can be transient.
+function shouldRetryQuery(failureCount: number, error: unknown): boolean {
+  if (failureCount >= MAX_QUERY_RETRIES) {
+    return false;
+  }
+
+  if (error instanceof APIError && error.status >= 400 && error.status < 500) {
+    return TRANSIENT_CLIENT_STATUSES.has(error.status);
+  }
+
+  return true;
+}
+
+const RETRY_BASE_DELAY_MS = 500;
+const RETRY_MAX_DELAY_MS = 30 * 1000;
+
+// Full-jitter backoff: spread retries over the whole capped window so tabs
+// or queries that failed together (e.g. on a provider 429) do not retry in
+// lockstep.
+function queryRetryDelay(failureCount: number): number {
+  return Math.random() * Math.min(RETRY_MAX_DELAY_MS, RETRY_BASE_DELAY_MS * 2 ** failureCount);
+}
+
 const queryClient = new QueryClient({
   defaultOptions: {
     queries: {
       staleTime: 1000 * 60 * 5, // 5 minutes
-      retry: 1,
+      retry: shouldRetryQuery,
+      retryDelay: queryRetryDelay,
     },
   },
 });
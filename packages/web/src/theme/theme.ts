@@ -32,6 +32,12 @@ const TOKENIZER_OVERRIDE_MAP: Record<string, keyof ThemeColors> = {
 
 type ThemeFieldSection = 'app' | 'tokenizer';
 
+// Built once so resolving overrides is a single table-driven pass.
+const THEME_OVERRIDE_MAPS: ReadonlyArray<[ThemeFieldSection, Record<string, keyof ThemeColors>]> = [
+  ['app', APP_OVERRIDE_MAP],
+  ['tokenizer', TOKENIZER_OVERRIDE_MAP],
+];
+
 export interface ThemeFieldDefinition {
   section: ThemeFieldSection;
   key: string;
@@ -86,38 +92,52 @@ export function resolveThemeColors(
     ...preset.colors,
   };
 
-  for (const [overrideKey, value] of Object.entries(overrides?.app ?? {})) {
-    if (!value) {
-      continue;
-    }
+  for (const [section, overrideMap] of THEME_OVERRIDE_MAPS) {
+    for (const [overrideKey, value] of Object.entries(overrides?.[section] ?? {})) {
+      if (!value) {
+        continue;
+      }
 
-    const mappedKey = APP_OVERRIDE_MAP[overrideKey];
-    if (mappedKey) {
-      merged[mappedKey] = value;
+      const mappedKey = overrideMap[overrideKey];
+      if (mappedKey) {
+        merged[mappedKey] = value;
+      }
     }
   }
 
-  for (const [overrideKey, value] of Object.entries(overrides?.tokenizer ?? {})) {
-    if (!value) {
-      continue;
-    }
+  return merged;
+}
 
-    const mappedKey = TOKENIZER_OVERRIDE_MAP[overrideKey];
-    if (mappedKey) {
-      merged[mappedKey] = value;
-    }
+const HEX_COLOR_PATTERN = /^[0-9a-fA-F]{6}$/;
+const HSL_CACHE_LIMIT = 64;
+const hslCache = new Map<string, string>();
+
+// The same few hex values recur within a theme (text, border, button text)
+// and across presets, so each distinct color is converted once.
+function hexToHsl(hex: string): string {
+  const cached = hslCache.get(hex);
+  if (cached !== undefined) {
+    return cached;
   }
 
-  return merged;
+  const hsl = convertHexToHsl(hex);
+  if (hslCache.size >= HSL_CACHE_LIMIT) {
+    const oldestKey = hslCache.keys().next().value;
+    if (oldestKey !== undefined) {
+      hslCache.delete(oldestKey);
+    }
+  }
+  hslCache.set(hex, hsl);
+  return hsl;
 }
 
-function hexToHsl(hex: string): string {
+function convertHexToHsl(hex: string): string {
   const normalized = hex.replace('#', '').trim();
   const expanded = normalized.length === 3
-    ? normalized.split('').map((value) => value + value).join('')
+    ? normalized[0] + normalized[0] + normalized[1] + normalized[1] + normalized[2] + normalized[2]
     : normalized;
 
-  if (!/^[0-9a-fA-F]{6}$/.test(expanded)) {
+  if (!HEX_COLOR_PATTERN.test(expanded)) {
     return '0 0% 0%';
   }
 
@@ -177,13 +197,24 @@ export function themeColorsToCssVariables(colors: ThemeColors): Record<string, s
   };
 }
 
+let lastAppliedThemeKey: string | null = null;
+
 export function applyThemeToDocument(colors: ThemeColors): void {
+  // Every setProperty call invalidates styles for the whole document, so
+  // skip the write entirely when the same colors are already applied. The
+  // key is the whole color object, so no field can be left out of it.
+  const themeKey = JSON.stringify(colors);
+  if (themeKey === lastAppliedThemeKey) {
+    return;
+  }
+  lastAppliedThemeKey = themeKey;
+
   const root = document.documentElement;
   const variables = themeColorsToCssVariables(colors);
 
-  Object.entries(variables).forEach(([key, value]) => {
+  for (const [key, value] of Object.entries(variables)) {
     root.style.setProperty(key, value);
-  });
+  }
 
   root.style.setProperty('--app-bg', colors.background);
   root.style.setProperty('--app-surface', colors.surface);